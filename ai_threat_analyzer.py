@@ -7,6 +7,21 @@ from datetime import datetime
 import random
 import google.generativeai as genai
 
+# Threat levels stored as small integer codes in the threat history buffer
+THREAT_LEVELS = ['None', 'Low', 'Medium', 'High', 'Critical', 'Error', 'Unknown']
+THREAT_LEVEL_CODES = {level: code for code, level in enumerate(THREAT_LEVELS)}
+
+# Fixed-size ring buffer record for analyzed threats
+THREAT_HISTORY_SIZE = 4096
+THREAT_RECORD_DTYPE = np.dtype([
+    ('typing', 'f4'),
+    ('mouse', 'f4'),
+    ('ts', 'f8'),
+    ('severity', 'u1'),
+    ('if_suspicious', '?'),
+    ('svm_suspicious', '?')
+])
+
 class AIThreatAnalyzer:
     """
     Class for analyzing security threats using Google's Gemini AI model.
@@ -15,8 +30,9 @@ class AIThreatAnalyzer:
     
     def __init__(self):
         """Initialize the AI threat analyzer"""
-        if 'threat_history' not in st.session_state:
-            st.session_state.threat_history = []
+        if 'ai_threat_buffer' not in st.session_state:
+            st.session_state.ai_threat_buffer = np.zeros(THREAT_HISTORY_SIZE, dtype=THREAT_RECORD_DTYPE)
+            st.session_state.ai_threat_head = 0
             
         # Set default API key for demo purposes
         # In a real production environment, this would be securely stored
@@ -339,31 +355,58 @@ Your response should start with "Threat Level: " followed by the assessment leve
         svm_verdict: str
             The One-Class SVM verdict
         """
-        threat = {
-            'timestamp': datetime.now(),
-            'threat_level': threat_level,
-            'typing_speed': typing_speed,
-            'mouse_speed': mouse_speed,
-            'isolation_forest_verdict': if_verdict,
-            'one_class_svm_verdict': svm_verdict
-        }
+        buffer = st.session_state.ai_threat_buffer
+        head = st.session_state.ai_threat_head
+        
+        # Overwrite the oldest slot once the buffer is full
+        buffer[head % THREAT_HISTORY_SIZE] = (
+            typing_speed,
+            mouse_speed,
+            datetime.now().timestamp(),
+            THREAT_LEVEL_CODES.get(threat_level, THREAT_LEVEL_CODES['Unknown']),
+            if_verdict == 'Suspicious',
+            svm_verdict == 'Suspicious'
+        )
+        st.session_state.ai_threat_head = head + 1
+    
+    def get_threat_history(self):
+        """
+        Return the recorded threats in chronological order as a DataFrame
+        
+        Returns:
+        --------
+        history: pandas.DataFrame
+            One row per recorded threat, oldest first
+        """
+        buffer = st.session_state.ai_threat_buffer
+        head = st.session_state.ai_threat_head
         
-        st.session_state.threat_history.append(threat)
+        if head <= THREAT_HISTORY_SIZE:
+            records = buffer[:head]
+        else:
+            # Unroll the ring so the oldest surviving entry comes first
+            records = np.roll(buffer, -(head % THREAT_HISTORY_SIZE))
         
-        # Keep only the last 50 threats
-        if len(st.session_state.threat_history) > 50:
-            st.session_state.threat_history.pop(0)
+        verdicts = np.array(['Normal', 'Suspicious'])
+        return pd.DataFrame({
+            'timestamp': [datetime.fromtimestamp(ts) for ts in records['ts']],
+            'threat_level': np.array(THREAT_LEVELS)[records['severity']],
+            'typing_speed': records['typing'],
+            'mouse_speed': records['mouse'],
+            'isolation_forest_verdict': verdicts[records['if_suspicious'].astype(int)],
+            'one_class_svm_verdict': verdicts[records['svm_suspicious'].astype(int)]
+        })
     
     def show_threat_dashboard(self):
         """Display a dashboard of threat history"""
-        if not st.session_state.threat_history:
+        if st.session_state.ai_threat_head == 0:
             st.info("No threat history available. Start analyzing threats to build a history.")
             return
         
         st.subheader("Threat Intelligence Dashboard")
         
         # Convert threat history to DataFrame
-        df = pd.DataFrame(st.session_state.threat_history)
+        df = self.get_threat_history()
         
         # Display summary metrics
         col1, col2, col3 = st.columns(3)
@@ -423,6 +466,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
             
             # Display the pie chart
             st.pyplot(fig)
+            plt.close(fig)
             
             # Show timeline of threats
             st.subheader("Threat Timeline")
@@ -475,6 +519,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
             plt.tight_layout()
             
             st.pyplot(fig)
+            plt.close(fig)
             
             # Show latest threat details
             st.subheader("Latest Threat Details")
@@ -2,17 +2,14 @@ import streamlit as st
 from streamlit.components.v1 import html
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import IsolationForest
-from sklearn.svm import OneClassSVM
+import altair as alt
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from io import BytesIO
 import time
 from datetime import datetime
+from io import BytesIO
+from sklearn.ensemble import IsolationForest
 
-from zero_trust import ZeroTrustSecuritySystem
-from quantum_visualization import create_quantum_animation, get_next_animation_frame
-from presentation_guide import display_presentation_guide
+from zero_trust import ZeroTrustSecuritySystem, UserPopulation
 from utils import load_logo
 from biometric_collector import BiometricCollector
 from ai_threat_analyzer import AIThreatAnalyzer
@@ -132,8 +129,12 @@ if 'normal_users' not in st.session_state:
     st.session_state.normal_users = None
 if 'suspicious_users' not in st.session_state:
     st.session_state.suspicious_users = None
+if 'user_population' not in st.session_state:
+    st.session_state.user_population = None
 if 'model' not in st.session_state:
     st.session_state.model = None
+if 'behavior_histograms' not in st.session_state:
+    st.session_state.behavior_histograms = None
 if 'animation_created' not in st.session_state:
     st.session_state.animation_created = False
 if 'animation_data' not in st.session_state:
@@ -148,9 +149,9 @@ enterprise_dashboard = EnterpriseThreatDashboard()
 
 def increment_user():
     """Function to increment the current user index when the button is clicked"""
-    # Increment the user index and wrap around if needed
+    # Increment the user index and wrap around if needed; the button click
+    # already triggers a rerun, so no explicit st.rerun() is needed here
     st.session_state.current_user_index = (st.session_state.current_user_index + 1) % (len(st.session_state.normal_users) + len(st.session_state.suspicious_users))
-    st.rerun()
 
 def toggle_api_key_input():
     """Toggle the visibility of the API key input field"""
@@ -160,6 +161,79 @@ def toggle_real_time_monitoring():
     """Toggle real-time monitoring mode"""
     st.session_state.real_time_monitoring = not st.session_state.real_time_monitoring
 
+@st.cache_resource
+def fit_isolation_forest(X):
+    """Fit the population Isolation Forest once per training set and share it across sessions"""
+    model = IsolationForest(contamination=0.1, random_state=42, n_jobs=-1)
+    model.fit(X)
+    return model
+
+# SVG path used to draw the current user as a star in Altair charts
+STAR_SHAPE = "M0,-1L0.2245,-0.309L0.9511,-0.309L0.3633,0.118L0.5878,0.809L0,0.382L-0.5878,0.809L-0.3633,0.118L-0.9511,-0.309L-0.2245,-0.309Z"
+
+GROUP_NAMES = np.array(['Normal Users', 'Suspicious Users'])
+
+@st.cache_resource
+def make_scatter_chart(typing, mouse, label):
+    """Build the user population layer of the behavior scatter plot once"""
+    population = pd.DataFrame({
+        'typing_speed': typing,
+        'mouse_movement_speed': mouse,
+        'group': GROUP_NAMES[label]
+    })
+    return alt.Chart(population, title='User Behavior Patterns').mark_circle(opacity=0.5, size=40).encode(
+        x=alt.X('typing_speed:Q', title='Typing Speed (keystrokes/sec)'),
+        y=alt.Y('mouse_movement_speed:Q', title='Mouse Movement (pixels/sec)'),
+        color=alt.Color('group:N', title=None,
+                        scale=alt.Scale(domain=['Normal Users', 'Suspicious Users'], range=['blue', 'red'])),
+        tooltip=['group', 'typing_speed', 'mouse_movement_speed']
+    )
+
+def compute_histograms(population, bins=15):
+    """Bin both populations once per data set so reruns only draw precomputed bars"""
+    histograms = {}
+    for column, values in [('typing_speed', population.typing), ('mouse_movement_speed', population.mouse)]:
+        frames = []
+        for code, group in enumerate(GROUP_NAMES):
+            group_values = values[population.label == code]
+            if group_values.size == 0:
+                continue
+            counts, edges = np.histogram(group_values, bins=bins)
+            frames.append(pd.DataFrame({
+                'bin_start': edges[:-1],
+                'bin_end': edges[1:],
+                'count': counts,
+                'group': group
+            }))
+        histograms[column] = pd.concat(frames, ignore_index=True)
+    return histograms
+
+@st.cache_resource
+def make_hist_chart(histogram, xlabel, title):
+    """Build the population layer of a behavior distribution histogram once"""
+    return alt.Chart(histogram, title=title).mark_bar(opacity=0.5).encode(
+        x=alt.X('bin_start:Q', title=xlabel),
+        x2='bin_end:Q',
+        y=alt.Y('count:Q', title='Count', stack=None),
+        color=alt.Color('group:N', title=None)
+    )
+
+def current_user_layer(current_user):
+    """Star marker for the user currently being analyzed"""
+    return alt.Chart(pd.DataFrame({
+        'typing_speed': [current_user['typing_speed']],
+        'mouse_movement_speed': [current_user['mouse_movement_speed']]
+    })).mark_point(shape=STAR_SHAPE, size=300, filled=True, color='green').encode(
+        x='typing_speed:Q',
+        y='mouse_movement_speed:Q'
+    )
+
+def current_value_rule(value):
+    """Dashed vertical line marking the current user on a distribution histogram"""
+    return alt.Chart(pd.DataFrame({'value': [value]})).mark_rule(
+        color='green', strokeDash=[6, 4], strokeWidth=2
+    ).encode(x='value:Q')
+
 # Sidebar for navigation
 st.sidebar.title("RAIN™ Platform")
 page = st.sidebar.radio(
@@ -182,7 +256,163 @@ st.markdown("""
 <h3 style="text-align: center; color: #666; margin-top: 0;">Real-Time AI-Driven Threat Interceptor and Neutralizer</h3>
 """, unsafe_allow_html=True)
 
-if page == "Zero Trust Security":
+@st.fragment
+def render_current_user_analysis():
+    """Render the analysis for the current simulated user; reruns on its own when the next user is checked"""
+    # Prepare data for current user from the population arrays built at init time
+    if st.session_state.user_population is None:
+        st.session_state.user_population = UserPopulation.from_frames(
+            st.session_state.normal_users,
+            st.session_state.suspicious_users
+        )
+    population = st.session_state.user_population
+    index = st.session_state.current_user_index
+    current_user = {
+        'typing_speed': float(population.typing[index]),
+        'mouse_movement_speed': float(population.mouse[index])
+    }
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader(f"Analyzing User #{st.session_state.current_user_index + 1}")
+        
+        # Initialize ZeroTrustSecuritySystem if needed
+        if 'zero_trust_system' not in st.session_state:
+            st.session_state.zero_trust_system = ZeroTrustSecuritySystem()
+        
+        # Run analysis using ZeroTrustSecuritySystem
+        # The detection plot is not shown on this page, so skip building it
+        results = st.session_state.zero_trust_system.check_user_behavior({
+            'typing_speed': current_user['typing_speed'],
+            'mouse_speed': current_user['mouse_movement_speed']
+        }, show_plot=False)
+        
+        # Extract result values
+        overall_verdict = results['overall_verdict']
+        is_anomaly = overall_verdict.startswith("SUSPICIOUS")
+        # Calculate combined confidence from both algorithms
+        if_confidence = results['isolation_forest']['confidence']
+        svm_confidence = results['one_class_svm']['confidence']
+        confidence = (if_confidence + svm_confidence) / 2
+        predicted_label = "Suspicious" if is_anomaly else "Normal"
+        
+        # Display user metrics
+        metrics_col1, metrics_col2 = st.columns(2)
+        with metrics_col1:
+            st.metric("Typing Speed", f"{current_user['typing_speed']:.2f} keystrokes/sec")
+        with metrics_col2:
+            st.metric("Mouse Movement Speed", f"{current_user['mouse_movement_speed']:.2f} pixels/sec")
+        
+        # Display animation of typing and mouse movement (simulated)
+        progress_placeholder = st.empty()
+        
+        if not st.session_state.get('animation_running', False):
+            st.session_state.animation_running = True
+            
+            # Simulate typing and mouse movement with progress bars
+            progress_typing = st.progress(0)
+            progress_mouse = st.progress(0)
+            
+            st.markdown("**Typing Activity:**")
+            progress_typing_placeholder = st.empty()
+            
+            st.markdown("**Mouse Movement:**")
+            progress_mouse_placeholder = st.empty()
+            
+            # Animate for 3 seconds
+            for i in range(100):
+                # Typing animation
+                typing_progress = min(100, int(i * (current_user['typing_speed'] / 7) * 100))
+                progress_typing.progress(typing_progress / 100)
+                
+                # Mouse animation
+                mouse_progress = min(100, int(i * (current_user['mouse_movement_speed'] / 700) * 100))
+                progress_mouse.progress(mouse_progress / 100)
+                
+                time.sleep(0.03)
+            
+            st.session_state.animation_running = False
+        
+        # Display analysis results
+        st.subheader("Security Analysis")
+        
+        if is_anomaly:
+            st.error(f"⚠️ SECURITY ALERT: Suspicious behavior detected! (Confidence: {confidence:.2f}%)")
+            st.markdown("""
+            **Potential security threats:**
+            - Possible unauthorized user
+            - Potential automated attack
+            - Unusual user behavior pattern
+            
+            **Recommended actions:**
+            - Trigger additional authentication
+            - Temporarily restrict access
+            - Log event for further investigation
+            """)
+        else:
+            st.success(f"✓ Normal user behavior confirmed (Confidence: {confidence:.2f}%)")
+        
+    with col2:
+        # User behavior visualization
+        st.subheader("Behavior Analysis")
+        
+        # Cached population layer plus a lightweight current-user layer
+        scatter_chart = make_scatter_chart(population.typing, population.mouse, population.label)
+        st.altair_chart(
+            scatter_chart + current_user_layer(current_user),
+            use_container_width=True,
+            key='behavior'
+        )
+        
+        # Add a button to check the next user
+        if st.button("Check Next User", key="check_next", on_click=increment_user):
+            pass  # The on_click handler will handle this
+
+    # Show the overall user population statistics
+    st.subheader("System Statistics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Users Monitored", len(population.label))
+    with col2:
+        st.metric("Normal Users", int(np.count_nonzero(population.label == 0)))
+    with col3:
+        st.metric("Suspicious Users", int(np.count_nonzero(population.label == 1)))
+        
+    # Display data distributions
+    st.subheader("User Behavior Distribution")
+    dist_col1, dist_col2 = st.columns(2)
+    
+    if st.session_state.behavior_histograms is None:
+        st.session_state.behavior_histograms = compute_histograms(population)
+    histograms = st.session_state.behavior_histograms
+    
+    with dist_col1:
+        # Typing speed histogram
+        typing_chart = make_hist_chart(
+            histograms['typing_speed'],
+            'Typing Speed (keystrokes/sec)', 'Typing Speed Distribution'
+        )
+        st.altair_chart(
+            typing_chart + current_value_rule(current_user['typing_speed']),
+            use_container_width=True,
+            key='typing_distribution'
+        )
+        
+    with dist_col2:
+        # Mouse movement histogram
+        mouse_chart = make_hist_chart(
+            histograms['mouse_movement_speed'],
+            'Mouse Movement Speed (pixels/sec)', 'Mouse Movement Distribution'
+        )
+        st.altair_chart(
+            mouse_chart + current_value_rule(current_user['mouse_movement_speed']),
+            use_container_width=True,
+            key='mouse_distribution'
+        )
+
+def render_zero_trust():
+    """Render the Zero Trust Security page"""
     st.header("RAIN™ Zero Trust Security")
     
     # Description of the Zero Trust model
@@ -322,8 +552,11 @@ if page == "Zero Trust Security":
                         # The empty else block is intentional - no message needed since API key is provided automatically
                     
                     with col2:
-                        # Display the comparison plot
-                        st.pyplot(results['plot'])
+                        # Display the comparison plot, rasterized once at screen resolution
+                        plot_png = BytesIO()
+                        results['plot'].savefig(plot_png, format='png', dpi=100, bbox_inches='tight')
+                        plt.close(results['plot'])
+                        st.image(plot_png.getvalue())
                         
                         # Display recommended actions
                         st.markdown("### Recommended Actions")
@@ -377,14 +610,17 @@ if page == "Zero Trust Security":
                     st.session_state.normal_users = normal_users
                     st.session_state.suspicious_users = suspicious_users
                     
-                    # Combine data for model training
-                    all_users = pd.concat([normal_users, suspicious_users])
-                    X = all_users[['typing_speed', 'mouse_movement_speed']]
+                    # Keep the population as plain arrays for plots, histograms and the model
+                    population = UserPopulation.from_frames(normal_users, suspicious_users)
+                    st.session_state.user_population = population
                     
-                    # Train Isolation Forest model
-                    model = IsolationForest(contamination=0.1, random_state=42)
-                    model.fit(X)
-                    st.session_state.model = model
+                    # Precompute distribution histograms for the new data
+                    st.session_state.behavior_histograms = compute_histograms(population)
+                    
+                    X = population.features()
+                    
+                    # Train (or reuse the cached) Isolation Forest model
+                    st.session_state.model = fit_isolation_forest(X)
                     
                     st.session_state.current_user_index = 0
                     
@@ -392,172 +628,7 @@ if page == "Zero Trust Security":
 
         # Display the current user and analysis results if data is loaded
         if st.session_state.normal_users is not None and st.session_state.model is not None:
-            # Prepare data for current user
-            all_users = pd.concat([st.session_state.normal_users, st.session_state.suspicious_users])
-            current_user = all_users.iloc[st.session_state.current_user_index]
-            
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.subheader(f"Analyzing User #{st.session_state.current_user_index + 1}")
-                
-                # Initialize ZeroTrustSecuritySystem if needed
-                if 'zero_trust_system' not in st.session_state:
-                    st.session_state.zero_trust_system = ZeroTrustSecuritySystem()
-                
-                # Run analysis using ZeroTrustSecuritySystem
-                results = st.session_state.zero_trust_system.check_user_behavior({
-                    'typing_speed': current_user['typing_speed'],
-                    'mouse_speed': current_user['mouse_movement_speed']
-                })
-                
-                # Extract result values
-                overall_verdict = results['overall_verdict']
-                is_anomaly = overall_verdict.startswith("SUSPICIOUS")
-                # Calculate combined confidence from both algorithms
-                if_confidence = results['isolation_forest']['confidence']
-                svm_confidence = results['one_class_svm']['confidence']
-                confidence = (if_confidence + svm_confidence) / 2
-                predicted_label = "Suspicious" if is_anomaly else "Normal"
-                
-                # Display user metrics
-                metrics_col1, metrics_col2 = st.columns(2)
-                with metrics_col1:
-                    st.metric("Typing Speed", f"{current_user['typing_speed']:.2f} keystrokes/sec")
-                with metrics_col2:
-                    st.metric("Mouse Movement Speed", f"{current_user['mouse_movement_speed']:.2f} pixels/sec")
-                
-                # Display animation of typing and mouse movement (simulated)
-                progress_placeholder = st.empty()
-                
-                if not st.session_state.get('animation_running', False):
-                    st.session_state.animation_running = True
-                    
-                    # Simulate typing and mouse movement with progress bars
-                    progress_typing = st.progress(0)
-                    progress_mouse = st.progress(0)
-                    
-                    st.markdown("**Typing Activity:**")
-                    progress_typing_placeholder = st.empty()
-                    
-                    st.markdown("**Mouse Movement:**")
-                    progress_mouse_placeholder = st.empty()
-                    
-                    # Animate for 3 seconds
-                    for i in range(100):
-                        # Typing animation
-                        typing_progress = min(100, int(i * (current_user['typing_speed'] / 7) * 100))
-                        progress_typing.progress(typing_progress / 100)
-                        
-                        # Mouse animation
-                        mouse_progress = min(100, int(i * (current_user['mouse_movement_speed'] / 700) * 100))
-                        progress_mouse.progress(mouse_progress / 100)
-                        
-                        time.sleep(0.03)
-                    
-                    st.session_state.animation_running = False
-                
-                # Display analysis results
-                st.subheader("Security Analysis")
-                
-                if is_anomaly:
-                    st.error(f"⚠️ SECURITY ALERT: Suspicious behavior detected! (Confidence: {confidence:.2f}%)")
-                    st.markdown("""
-                    **Potential security threats:**
-                    - Possible unauthorized user
-                    - Potential automated attack
-                    - Unusual user behavior pattern
-                    
-                    **Recommended actions:**
-                    - Trigger additional authentication
-                    - Temporarily restrict access
-                    - Log event for further investigation
-                    """)
-                else:
-                    st.success(f"✓ Normal user behavior confirmed (Confidence: {confidence:.2f}%)")
-                
-            with col2:
-                # User behavior visualization
-                st.subheader("Behavior Analysis")
-                
-                # Create scatter plot of all users with current user highlighted
-                fig, ax = plt.subplots(figsize=(5, 5))
-                
-                # Plot normal users if data exists
-                if st.session_state.normal_users is not None and not st.session_state.normal_users.empty:
-                    ax.scatter(
-                        st.session_state.normal_users['typing_speed'],
-                        st.session_state.normal_users['mouse_movement_speed'],
-                        color='blue', alpha=0.5, label='Normal Users'
-                    )
-                
-                # Plot suspicious users if data exists
-                if st.session_state.suspicious_users is not None and not st.session_state.suspicious_users.empty:
-                    ax.scatter(
-                        st.session_state.suspicious_users['typing_speed'],
-                        st.session_state.suspicious_users['mouse_movement_speed'],
-                        color='red', alpha=0.5, label='Suspicious Users'
-                    )
-                
-                # Highlight current user
-                ax.scatter(
-                    current_user['typing_speed'], 
-                    current_user['mouse_movement_speed'],
-                    color='green', s=200, marker='*', label='Current User'
-                )
-                
-                ax.set_xlabel('Typing Speed (keystrokes/sec)')
-                ax.set_ylabel('Mouse Movement (pixels/sec)')
-                ax.set_title('User Behavior Patterns')
-                ax.legend()
-                
-                st.pyplot(fig)
-                
-                # Add a button to check the next user
-                if st.button("Check Next User", key="check_next", on_click=increment_user):
-                    pass  # The on_click handler will handle this
-
-            # Show the overall user population statistics
-            st.subheader("System Statistics")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Users Monitored", len(all_users))
-            with col2:
-                st.metric("Normal Users", len(st.session_state.normal_users) if st.session_state.normal_users is not None else 0)
-            with col3:
-                st.metric("Suspicious Users", len(st.session_state.suspicious_users) if st.session_state.suspicious_users is not None else 0)
-                
-            # Display data distributions
-            st.subheader("User Behavior Distribution")
-            dist_col1, dist_col2 = st.columns(2)
-            
-            with dist_col1:
-                # Typing speed histogram
-                fig, ax = plt.subplots()
-                if st.session_state.normal_users is not None and not st.session_state.normal_users.empty:
-                    ax.hist(st.session_state.normal_users['typing_speed'], alpha=0.5, bins=15, label='Normal Users')
-                if st.session_state.suspicious_users is not None and not st.session_state.suspicious_users.empty:
-                    ax.hist(st.session_state.suspicious_users['typing_speed'], alpha=0.5, bins=15, label='Suspicious Users')
-                ax.set_xlabel('Typing Speed (keystrokes/sec)')
-                ax.set_ylabel('Count')
-                ax.set_title('Typing Speed Distribution')
-                ax.axvline(x=current_user['typing_speed'], color='green', linestyle='--', linewidth=2)
-                ax.legend()
-                st.pyplot(fig)
-                
-            with dist_col2:
-                # Mouse movement histogram
-                fig, ax = plt.subplots()
-                if st.session_state.normal_users is not None and not st.session_state.normal_users.empty:
-                    ax.hist(st.session_state.normal_users['mouse_movement_speed'], alpha=0.5, bins=15, label='Normal Users')
-                if st.session_state.suspicious_users is not None and not st.session_state.suspicious_users.empty:
-                    ax.hist(st.session_state.suspicious_users['mouse_movement_speed'], alpha=0.5, bins=15, label='Suspicious Users')
-                ax.set_xlabel('Mouse Movement Speed (pixels/sec)')
-                ax.set_ylabel('Count')
-                ax.set_title('Mouse Movement Distribution')
-                ax.axvline(x=current_user['mouse_movement_speed'], color='green', linestyle='--', linewidth=2)
-                ax.legend()
-                st.pyplot(fig)
+            render_current_user_analysis()
         
         else:
             st.info("Please initialize the system by clicking the button above.")
@@ -565,7 +636,8 @@ if page == "Zero Trust Security":
 # AI Threat Intelligence section completely removed from the interface
 # Functionality is still available in the backend and used by other components
 
-elif page == "User Behavior Analysis":
+def render_user_behavior_analysis():
+    """Render the User Behavior Analysis page"""
     st.header("RAIN™ User Behavior Analysis")
     
     with st.expander("How does the Web Surfing Security System work?", expanded=False):
@@ -1444,7 +1516,11 @@ elif page == "User Behavior Analysis":
                 - ✅ IP address added to monitoring list
                 """)
 
-elif page == "Quantum Security Visualization":
+def render_quantum_visualization():
+    """Render the Quantum Security Visualization page"""
+    # Import the animation module only when this page is rendered
+    from quantum_visualization import create_quantum_animation, get_next_animation_frame
+    
     st.header("RAIN™ Quantum-Resistant Security")
     
     with st.expander("What is Quantum-Resistant Cryptography?", expanded=False):
@@ -1562,23 +1638,41 @@ elif page == "Quantum Security Visualization":
             These algorithms are being standardized by NIST as part of their Post-Quantum Cryptography standardization process.
             """)
 
-elif page == "Enterprise Security Dashboard":
+def render_enterprise_dashboard():
+    """Render the Enterprise Security Dashboard page"""
     st.header("RAIN™ Enterprise Security Dashboard")
     
     # Use the enterprise dashboard class to display comprehensive security information
     enterprise_dashboard.display_enterprise_dashboard()
 
-elif page == "Executive Presentation":
+def render_executive_presentation():
+    """Render the Executive Presentation page"""
+    # Import the presentation guide module
+    from presentation_guide import display_presentation_guide
+    
     # Display the presentation guide
     display_presentation_guide()
 
-elif page == "Enterprise Website":
+def render_enterprise_website():
+    """Render the Enterprise Website page"""
     # Import the Enterprise Website redirect module
     from ai_video_presentation import display_ai_video_presentation
     
     # Display the Enterprise Website redirect interface
     display_ai_video_presentation()
 
+# Map each sidebar entry to its page renderer
+PAGES = {
+    "Zero Trust Security": render_zero_trust,
+    "User Behavior Analysis": render_user_behavior_analysis,
+    "Quantum Security Visualization": render_quantum_visualization,
+    "Enterprise Security Dashboard": render_enterprise_dashboard,
+    "Executive Presentation": render_executive_presentation,
+    "Enterprise Website": render_enterprise_website
+}
+
+PAGES[page]()
+
 # Footer
 st.markdown("---")
 st.markdown("""
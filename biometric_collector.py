@@ -2,131 +2,347 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import time
+import warnings
+from collections import deque
 import matplotlib.pyplot as plt
+import altair as alt
 from datetime import datetime, timedelta
 from io import BytesIO
 from sklearn.ensemble import IsolationForest
 from sklearn.svm import OneClassSVM
+from sklearn.linear_model import SGDOneClassSVM
+from sklearn.kernel_approximation import Nystroem
+from sklearn.pipeline import make_pipeline
+from scipy.special import expit
+from utils import simulate_user_population, decision_grid
+
+# Upper bound on keystroke timestamps kept (far more than 3 seconds of typing)
+KEYPRESS_BUFFER_SIZE = 256
+
+# Number of recent speed measurements kept for trending
+TYPING_HISTORY_SIZE = 20
+
+# Styling for the typing area and security status badges
+TYPING_AREA_STYLE = """
+<style>
+.typing-area {
+    border: 2px solid #0068C9;
+    border-radius: 10px;
+    padding: 15px;
+    background-color: #f0f8ff;
+    font-size: 16px;
+    height: 120px;
+    transition: all 0.3s;
+}
+.typing-area:focus {
+    border-color: #00C853;
+    box-shadow: 0 0 10px rgba(0, 200, 83, 0.3);
+}
+/* Enterprise styling enhancements */
+.enterprise-section {
+    border-left: 4px solid #0068C9;
+    padding-left: 15px;
+    margin: 15px 0;
+}
+.security-status {
+    font-weight: bold;
+    padding: 8px 15px;
+    border-radius: 20px;
+    display: inline-block;
+    margin-top: 10px;
+}
+.security-status.normal {
+    background-color: #e8f5e9;
+    color: #2e7d32;
+    border: 1px solid #2e7d32;
+}
+.security-status.warning {
+    background-color: #fff8e1;
+    color: #f57c00;
+    border: 1px solid #f57c00;
+}
+.security-status.alert {
+    background-color: #ffebee;
+    color: #c62828;
+    border: 1px solid #c62828;
+}
+/* Current/average speed readouts, rendered with the status in one element */
+.speed-metrics {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 15px;
+    margin-top: 15px;
+}
+.speed-metric .label {
+    font-size: 14px;
+    color: #555;
+}
+.speed-metric .value {
+    font-size: 28px;
+}
+.speed-metric .delta.up {
+    color: #2e7d32;
+}
+.speed-metric .delta.down {
+    color: #c62828;
+}
+/* Button styling */
+.analyze-button {
+    background-color: #0068C9;
+    color: white;
+    font-weight: bold;
+    padding: 10px 20px;
+    border-radius: 5px;
+    border: none;
+    cursor: pointer;
+    transition: all 0.3s;
+    margin-top: 15px;
+    width: 100%;
+}
+.analyze-button:hover {
+    background-color: #004c94;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+}
+</style>
+"""
+
+# Shaded zones of the typing speed chart: (color, legend label)
+TYPING_ZONES = {
+    'normal': ('green', 'Normal Range'),
+    'fast': ('red', 'Suspicious (Too Fast)'),
+    'slow': ('orange', 'Suspicious (Too Slow)')
+}
+
+# Minimum share of training rows on which the thinned Isolation Forest must
+# agree with a full 100-tree forest
+ISOLATION_FOREST_MIN_AGREEMENT = 0.95
+
+# Largest training set fitted with the exact (libsvm) One-Class SVM
+OCSVM_EXACT_MAX_ROWS = 2000
+
+@st.cache_data(ttl=24*60*60)
+def _simulate_speed_columns(normal_count, suspicious_count, seed=42):
+    """
+    Draw the comparison population as float32 columns.
+    Returns (normal_typing, normal_mouse, suspicious_typing, suspicious_mouse).
+    """
+    return tuple(column.astype(np.float32) for column in simulate_user_population(normal_count, suspicious_count, seed))
+
+def _keystroke_rate(count, time_window):
+    """Keystrokes per second for `count` keystrokes spread over `time_window` seconds"""
+    if time_window > 0:
+        # Calculate keystrokes per second with a minimum to avoid division by very small numbers
+        return max(1, count - 1) / max(0.1, time_window)
+    # Fallback if time window is too small
+    return 4.0
+
+def _typing_smoothing_alpha(history_len):
+    """
+    Ultra-responsive smoothing for immediate feedback.
+    Higher alpha values give more weight to the most recent typing speed.
+    """
+    if history_len < 2:
+        return 1.0  # Instant response for first few keystrokes
+    if history_len < 4:
+        return 0.8  # Very responsive for next few keystrokes
+    return 0.5  # More stable but still responsive smoothing
+
+def _exponential_smoothing(new_value, last_value, alpha):
+    """Blend a new measurement into the previous one; the first measurement is taken as is"""
+    if last_value > 0:
+        return (alpha * new_value) + ((1 - alpha) * last_value)
+    return new_value
+
+def _simulate_mouse_data(normal_count, suspicious_count):
+    """Wrap the cached comparison population columns in the per-group DataFrames"""
+    normal_typing_speeds, normal_mouse_speeds, suspicious_typing_speeds, suspicious_mouse_speeds = \
+        _simulate_speed_columns(normal_count, suspicious_count)
+    
+    # Create DataFrames
+    normal_users_df = pd.DataFrame({
+        'user_id': [f'normal_user_{i}' for i in range(normal_count)],
+        'typing_speed': normal_typing_speeds,
+        'mouse_movement_speed': normal_mouse_speeds,
+        'is_suspicious': False
+    })
+    
+    suspicious_users_df = pd.DataFrame({
+        'user_id': [f'suspicious_user_{i}' for i in range(suspicious_count)],
+        'typing_speed': suspicious_typing_speeds,
+        'mouse_movement_speed': suspicious_mouse_speeds,
+        'is_suspicious': True
+    })
+    
+    return normal_users_df, suspicious_users_df
+
+def _feature_matrix(users_df):
+    """(typing, mouse) features of a user DataFrame as one contiguous float32 array"""
+    return np.ascontiguousarray(users_df[['typing_speed', 'mouse_movement_speed']].to_numpy(dtype=np.float32))
+
+@st.cache_resource
+def _get_isolation_forest(normal_X, suspicious_X):
+    """
+    Fit the Isolation Forest on a population once and share it across sessions.
+    Cached on the feature arrays themselves, so each population gets its own model.
+    """
+    X_train = np.concatenate((normal_X, suspicious_X))
+    # 32 trees of 64 samples are plenty for a 2-feature, ~110-row population
+    isolation_forest = IsolationForest(
+        contamination=0.1,  # Expect about 10% anomalies
+        random_state=42,
+        n_estimators=32,
+        max_samples=64,
+        n_jobs=-1
+    )
+    isolation_forest.fit(X_train)
+    return isolation_forest, X_train
+
+@st.cache_resource
+def _isolation_forest_agreement(normal_X, suspicious_X):
+    """
+    One-time stability check of the thinned forest against a full 100-tree forest.
+    Returns the share of training rows with the same verdict; cached per population,
+    so the reference forest is only fitted once.
+    """
+    isolation_forest, X_train = _get_isolation_forest(normal_X, suspicious_X)
+    reference = IsolationForest(contamination=0.1, random_state=42, n_estimators=100, n_jobs=-1).fit(X_train)
+    agreement = float(np.mean(isolation_forest.predict(X_train) == reference.predict(X_train)))
+    if agreement < ISOLATION_FOREST_MIN_AGREEMENT:
+        warnings.warn(
+            f"Thinned Isolation Forest agrees with the 100-tree model on only {agreement:.1%} of training rows"
+        )
+    return agreement
+
+@st.cache_resource
+def _get_one_class_svm(normal_X):
+    """Fit the One-Class SVM on a population's normal users once and share it across sessions"""
+    # Train only on normal data for One-Class SVM (more common approach)
+    X_train = normal_X
+    if len(X_train) > OCSVM_EXACT_MAX_ROWS:
+        # libsvm training grows quadratically with the row count, so large populations use a
+        # fixed-size Nystroem RBF approximation with a linear one-class SVM trained in O(n)
+        gamma = 1.0 / (X_train.shape[1] * X_train.var())  # Same as gamma='scale'
+        one_class_svm = make_pipeline(
+            Nystroem(gamma=gamma, n_components=100, random_state=42),
+            SGDOneClassSVM(nu=0.1, random_state=42)
+        )
+    else:
+        # Higher nu would only add support vectors (it lower-bounds their fraction)
+        one_class_svm = OneClassSVM(
+            nu=0.1,  # Similar to contamination
+            kernel='rbf',
+            gamma='scale'
+        )
+    one_class_svm.fit(X_train)
+    return one_class_svm, X_train
+
+@st.cache_resource
+def _typing_line_chart():
+    """Typing speed line layer without data; each run binds the current measurements"""
+    return alt.Chart().mark_line(color='#0068C9', strokeWidth=2).encode(
+        x=alt.X('measurement:Q', title='Time (most recent measurements)'),
+        y=alt.Y('speed:Q', title='Keystrokes/sec')
+    )
+
+@st.cache_resource
+def _typing_zones_chart(avg_speed):
+    """Shaded normal vs. suspicious zones around a (rounded) average typing speed"""
+    low, high = avg_speed * 0.7, avg_speed * 1.3
+    bands = [('normal', low, high), ('slow', 0.0, low)]
+    if high < 10:  # Don't shade too high
+        bands.insert(1, ('fast', high, 10.0))
+    zones = pd.DataFrame({
+        'zone': [TYPING_ZONES[name][1] for name, _, _ in bands],
+        'y_start': [start for _, start, _ in bands],
+        'y_end': [end for _, _, end in bands]
+    })
+    return alt.Chart(zones).mark_rect(opacity=0.2).encode(
+        y='y_start:Q',
+        y2='y_end:Q',
+        color=alt.Color('zone:N', title=None, scale=alt.Scale(
+            domain=[label for _, label in TYPING_ZONES.values()],
+            range=[color for color, _ in TYPING_ZONES.values()]
+        ))
+    )
+
+def _typing_average_rule(avg_speed):
+    """Dashed average line with its value written at the left edge"""
+    average = alt.Chart(pd.DataFrame({'speed': [avg_speed], 'label': [f'Average: {avg_speed:.2f}']}))
+    return average.mark_rule(color='#FF5252', strokeDash=[6, 4], opacity=0.7).encode(y='speed:Q') + \
+        average.mark_text(align='left', baseline='bottom', dx=4, dy=-2, color='#FF5252').encode(
+            x=alt.value(0), y='speed:Q', text='label:N'
+        )
+
+# Points per axis of the decision boundary grid; the level-0 contour is smooth at 40
+CONTOUR_RESOLUTION = 40
+
+@st.cache_data
+def _decision_surfaces(normal_X, suspicious_X, x_min, x_max, y_min, y_max):
+    """Score both models over the contour grid once per population and (rounded) axis limits"""
+    xx, yy, grid = decision_grid(x_min, x_max, y_min, y_max, CONTOUR_RESOLUTION)
+    isolation_forest, _ = _get_isolation_forest(normal_X, suspicious_X)
+    one_class_svm, _ = _get_one_class_svm(normal_X)
+    Z_if = isolation_forest.decision_function(grid).reshape(xx.shape)
+    Z_svm = one_class_svm.decision_function(grid).reshape(xx.shape)
+    return xx, yy, Z_if, Z_svm
 
 class BiometricCollector:
     """Class for collecting real biometric data (typing speed) from user interactions"""
     
     def __init__(self):
         """Initialize the biometric collector with session state variables"""
+        # Independent random stream for the simulated first-keystroke jitter
+        self._rng = np.random.default_rng()
+        
         # Initialize session state variables if they don't exist
         if 'keypress_times' not in st.session_state:
-            st.session_state.keypress_times = []
+            st.session_state.keypress_times = deque(maxlen=KEYPRESS_BUFFER_SIZE)
         if 'typing_speeds' not in st.session_state:
-            st.session_state.typing_speeds = []
+            st.session_state.typing_speeds = deque(maxlen=TYPING_HISTORY_SIZE)
+            st.session_state.typing_speed_sum = 0.0
         if 'last_typing_speed' not in st.session_state:
             st.session_state.last_typing_speed = 0.0
         if 'mouse_positions' not in st.session_state:
             st.session_state.mouse_positions = []
-        if 'mouse_speeds' not in st.session_state:
-            st.session_state.mouse_speeds = []
-        if 'last_mouse_speed' not in st.session_state:
-            st.session_state.last_mouse_speed = 0.0
-        if 'last_mouse_record_time' not in st.session_state:
-            st.session_state.last_mouse_record_time = time.time()
     
     def track_keystroke(self):
         """Record a keystroke event and calculate typing speed in real-time with enhanced responsiveness"""
         current_time = time.time()
-        st.session_state.keypress_times.append(current_time)
+        buffer = st.session_state.keypress_times
+        buffer.append(current_time)
         
-        # Keep only the last 3 seconds of keystrokes for more responsive real-time analysis
+        # Keep only the last 3 seconds of keystrokes for more responsive real-time analysis.
+        # Timestamps only grow, so expired entries are always at the left end
         cutoff_time = current_time - 3  # Reduced from 5 seconds to make it even more responsive
-        st.session_state.keypress_times = [t for t in st.session_state.keypress_times if t > cutoff_time]
+        while buffer[0] <= cutoff_time:
+            buffer.popleft()
+        count = len(buffer)
         
         # Calculate typing speed (keystrokes per second) with immediate feedback from the first keystroke
         # This ensures users see an immediate response when they start typing
-        if len(st.session_state.keypress_times) > 0:
+        if count > 0:
             # For first keystroke, use a reasonable default typing speed with slight randomization
-            if len(st.session_state.keypress_times) == 1:
-                new_typing_speed = 4.0 + np.random.uniform(-0.5, 0.5)
-            else:
-                time_window = current_time - st.session_state.keypress_times[0]
-                if time_window > 0:
-                    # Calculate keystrokes per second with a minimum to avoid division by very small numbers
-                    new_typing_speed = max(1, len(st.session_state.keypress_times) - 1) / max(0.1, time_window)
-                else:
-                    # Fallback if time window is too small
-                    new_typing_speed = 4.0
-            
-            # Ultra-responsive smoothing for immediate feedback
-            # Higher alpha values give more weight to the most recent typing speed
-            if len(st.session_state.typing_speeds) < 2:
-                alpha = 1.0  # Instant response for first few keystrokes
-            elif len(st.session_state.typing_speeds) < 4:
-                alpha = 0.8  # Very responsive for next few keystrokes
+            if count == 1:
+                new_typing_speed = 4.0 + self._rng.uniform(-0.5, 0.5)
             else:
-                alpha = 0.5  # More stable but still responsive smoothing
+                new_typing_speed = _keystroke_rate(count, current_time - buffer[0])
             
             # Apply exponential smoothing with high alpha for responsiveness
-            if st.session_state.last_typing_speed > 0:
-                smoothed_speed = (alpha * new_typing_speed) + ((1 - alpha) * st.session_state.last_typing_speed)
-            else:
-                smoothed_speed = new_typing_speed
+            alpha = _typing_smoothing_alpha(len(st.session_state.typing_speeds))
+            smoothed_speed = _exponential_smoothing(new_typing_speed, st.session_state.last_typing_speed, alpha)
             
-            # Update session state
+            # Update session state; the deque keeps only the last 20 measurements, and the
+            # running sum follows it so the average never has to walk the history
+            typing_speeds = st.session_state.typing_speeds
+            if len(typing_speeds) == typing_speeds.maxlen:
+                st.session_state.typing_speed_sum -= typing_speeds[0]
             st.session_state.last_typing_speed = smoothed_speed
-            st.session_state.typing_speeds.append(smoothed_speed)
-            
-            # Keep only the last 20 speed measurements for better trending and performance
-            if len(st.session_state.typing_speeds) > 20:
-                st.session_state.typing_speeds.pop(0)
-            
-            # Always update the mouse data when keystroke speed changes for correlated security metrics
-            self._update_simulated_mouse_data(smoothed_speed)
-    
-    def _update_simulated_mouse_data(self, typing_speed):
-        """
-        Update mouse movement data based on typing speed for real-time analysis.
-        This creates a realistic correlation between typing and mouse movements.
-        
-        Parameters:
-        -----------
-        typing_speed: float
-            The current typing speed to correlate with mouse movement
-        """
-        current_time = time.time()
-        
-        # Only update mouse data periodically to avoid excessive calculations
-        if current_time - st.session_state.last_mouse_record_time > 0.5:  # Update every 0.5 seconds
-            st.session_state.last_mouse_record_time = current_time
-            
-            # Create a realistic correlation between typing and mouse movement
-            # Faster typists tend to have faster mouse movements, but with variation
-            base_mouse_speed = typing_speed * 70  # Basic correlation factor
-            
-            # Add natural variation to simulate realistic patterns
-            variation = np.random.normal(0, 20)  # Normal distribution variation
-            
-            # Introduce occasional independent variations for more realism
-            if np.random.random() < 0.1:  # 10% chance of significant variation
-                variation = np.random.uniform(-100, 100)
-                
-            # Calculate new mouse speed with boundaries
-            new_mouse_speed = max(50, base_mouse_speed + variation)  # Minimum 50 px/sec
-            
-            # Apply smoothing for stability
-            alpha = 0.2  # Smoothing factor (0-1): lower = more smoothing
-            if st.session_state.last_mouse_speed > 0:
-                smoothed_mouse_speed = (alpha * new_mouse_speed) + ((1 - alpha) * st.session_state.last_mouse_speed)
-            else:
-                smoothed_mouse_speed = new_mouse_speed
-            
-            # Update session state
-            st.session_state.last_mouse_speed = smoothed_mouse_speed
-            st.session_state.mouse_speeds.append(smoothed_mouse_speed)
-            
-            # Keep the history limited
-            if len(st.session_state.mouse_speeds) > 30:
-                st.session_state.mouse_speeds.pop(0)
+            typing_speeds.append(smoothed_speed)
+            st.session_state.typing_speed_sum += smoothed_speed
     
     def capture_typing_data(self, key_suffix=""):
         """
-        Capture typing data using a Streamlit text area with JavaScript callback
+        Capture typing data using a Streamlit text area
         
         Parameters:
         -----------
@@ -134,78 +350,29 @@ class BiometricCollector:
             Optional suffix to add to the element keys to make them unique
             when the function is called multiple times in different contexts
         """
-        st.markdown("""
-        <style>
-        .typing-area {
-            border: 2px solid #0068C9;
-            border-radius: 10px;
-            padding: 15px;
-            background-color: #f0f8ff;
-            font-size: 16px;
-            height: 120px;
-            transition: all 0.3s;
-        }
-        .typing-area:focus {
-            border-color: #00C853;
-            box-shadow: 0 0 10px rgba(0, 200, 83, 0.3);
-        }
-        /* Enterprise styling enhancements */
-        .enterprise-section {
-            border-left: 4px solid #0068C9;
-            padding-left: 15px;
-            margin: 15px 0;
-        }
-        .security-status {
-            font-weight: bold;
-            padding: 8px 15px;
-            border-radius: 20px;
-            display: inline-block;
-            margin-top: 10px;
-        }
-        .security-status.normal {
-            background-color: #e8f5e9;
-            color: #2e7d32;
-            border: 1px solid #2e7d32;
-        }
-        .security-status.warning {
-            background-color: #fff8e1;
-            color: #f57c00;
-            border: 1px solid #f57c00;
-        }
-        .security-status.alert {
-            background-color: #ffebee;
-            color: #c62828;
-            border: 1px solid #c62828;
-        }
-        /* Button styling */
-        .analyze-button {
-            background-color: #0068C9;
-            color: white;
-            font-weight: bold;
-            padding: 10px 20px;
-            border-radius: 5px;
-            border: none;
-            cursor: pointer;
-            transition: all 0.3s;
-            margin-top: 15px;
-            width: 100%;
-        }
-        .analyze-button:hover {
-            background-color: #004c94;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(TYPING_AREA_STYLE, unsafe_allow_html=True)
         
         # Create a text area for typing with custom styling in first-person executive style
         st.markdown("### I analyze your typing patterns in real-time")
         st.markdown("As you type, I instantly evaluate your keystroke dynamics to verify your identity. My AI-powered analysis works seamlessly without requiring you to press any buttons.")
         
-        # Custom text area with real-time keystroke tracking using JavaScript
+        # Custom text area with real-time keystroke tracking
         if 'prev_text' not in st.session_state:
             st.session_state.prev_text = ""
         
-        # Create a text area element with custom JavaScript for real-time keystroke capture
+        self._typing_panel(key_suffix)
+        
+        text_input = st.session_state[f"typing_input{key_suffix}"]
+        analyze_button = st.session_state.pop(f"analyze_requested{key_suffix}", False)
+        return text_input, analyze_button
+    
+    @st.fragment
+    def _typing_panel(self, key_suffix):
+        """
+        Text area, controls and live biometrics. Typing only reruns this fragment,
+        not the page that embeds it.
+        """
+        # Create a text area element for keystroke capture
         text_input = st.text_area(
             "Your typing will be analyzed for security verification:",
             height=150,
@@ -213,105 +380,40 @@ class BiometricCollector:
             help="Type normally to generate biometric security data"
         )
         
-        # Add enhanced JavaScript for immediate keystroke detection and analysis
-        st.markdown("""
-        <script>
-            // Function to set up keystroke detection after DOM is fully loaded
-            document.addEventListener('DOMContentLoaded', function() {
-                setTimeout(setupKeystrokeTracking, 500); // Delay to ensure Streamlit elements are loaded
-            });
-            
-            // Also try to set up tracking when this script runs (backup approach)
-            setTimeout(setupKeystrokeTracking, 500);
-            
-            function setupKeystrokeTracking() {
-                // Try multiple selectors to find the text area
-                const textArea = 
-                    document.querySelector('textarea[data-testid="stTextArea"]') || 
-                    parent.document.querySelector('textarea[data-testid="stTextArea"]') ||
-                    document.querySelector('textarea') ||
-                    parent.document.querySelector('textarea');
-                
-                if (textArea) {
-                    console.log("Found text area for keystroke tracking");
-                    
-                    // Remove any existing event listeners
-                    const newTextArea = textArea.cloneNode(true);
-                    textArea.parentNode.replaceChild(newTextArea, textArea);
-                    
-                    // Add keydown event listener for immediate detection
-                    newTextArea.addEventListener('keydown', function(e) {
-                        console.log("Keystroke detected");
-                        // Force update on next animation frame for better performance
-                        window.requestAnimationFrame(function() {
-                            // Submit the form to trigger a rerun
-                            const form = newTextArea.closest('form');
-                            if (form) {
-                                console.log("Submitting form to trigger rerun");
-                                const submitButton = document.createElement('button');
-                                submitButton.type = 'submit';
-                                submitButton.style.display = 'none';
-                                form.appendChild(submitButton);
-                                submitButton.click();
-                                form.removeChild(submitButton);
-                            }
-                        });
-                    });
-                    
-                    // Also listen for input events as a fallback
-                    newTextArea.addEventListener('input', function(e) {
-                        console.log("Input event detected");
-                        // Auto-submit after a short delay
-                        setTimeout(function() {
-                            const form = newTextArea.closest('form');
-                            if (form) {
-                                const submitButton = document.createElement('button');
-                                submitButton.type = 'submit';
-                                submitButton.style.display = 'none';
-                                form.appendChild(submitButton);
-                                submitButton.click();
-                                form.removeChild(submitButton);
-                            }
-                        }, 100);
-                    });
-                    
-                    console.log("Keystroke tracking setup complete");
-                } else {
-                    console.log("Text area not found, will retry");
-                    // Retry after a delay if text area not found
-                    setTimeout(setupKeystrokeTracking, 1000);
-                }
-            }
-        </script>
-        """, unsafe_allow_html=True)
-        
-        # Track keystrokes by detecting changes in the text
+        # Track keystrokes by detecting changes in the text. The widgets below read the
+        # updated session state in this same run, so no extra rerun is needed
         if text_input != st.session_state.prev_text:
             # Text has changed, track a keystroke
             self.track_keystroke()
             st.session_state.prev_text = text_input
-            # Force a rerun to update the UI in real-time
-            st.rerun()
         
         # Add a manual analysis button (this will be used in app.py)
         col1, col2 = st.columns([3, 1])
         with col1:
-            analyze_button = st.button("🔒 Analyze Security Biometrics", type="primary", key=f"analyze_typing{key_suffix}")
+            # The caller acts on the click, so it has to rerun the whole app, not just this panel
+            if st.button("🔒 Analyze Security Biometrics", type="primary", key=f"analyze_typing{key_suffix}"):
+                st.session_state[f"analyze_requested{key_suffix}"] = True
+                st.rerun()
         with col2:
             # Add reset button to clear previous typing data
             if st.button("🔄 Reset Analysis", key=f"reset_typing{key_suffix}"):
-                st.session_state.typing_speeds = []
-                st.session_state.keypress_times = []
+                st.session_state.typing_speeds.clear()
+                st.session_state.typing_speed_sum = 0.0
+                st.session_state.keypress_times.clear()
                 st.session_state.last_typing_speed = 0.0
                 st.session_state.prev_text = ""
                 st.rerun()
         
+        self._render_typing_biometrics(key_suffix)
+    
+    def _render_typing_biometrics(self, key_suffix):
+        """Security status, speed metrics, chart and explanation for the typing captured so far"""
         # Display current typing speed immediately after even a single keystroke
         # This ensures immediate feedback without waiting for a significant sample
         if st.session_state.keypress_times:  # Changed from typing_speeds to keypress_times for faster response
             # Calculate average even with just 1-2 keystrokes for immediate feedback
             if st.session_state.typing_speeds:
-                avg_speed = sum(st.session_state.typing_speeds) / len(st.session_state.typing_speeds)
+                avg_speed = st.session_state.typing_speed_sum / len(st.session_state.typing_speeds)
             else:
                 # If we have keypress_times but no typing_speeds yet, show a reasonable default
                 avg_speed = 4.0  # Default "normal" typing speed as immediate placeholder
@@ -327,56 +429,49 @@ class BiometricCollector:
                 security_status = "warning"
                 security_message = "Caution: Unusually Slow Typing"
             
+            # Status and both speed readouts go out as a single element rather than
+            # a columns block with two st.metric calls, trimming per-keystroke deltas
+            last_speed = st.session_state.last_typing_speed
+            speed_delta = ""
+            if len(st.session_state.typing_speeds) > 1:
+                delta = last_speed - avg_speed
+                speed_delta = f'<div class="delta {"up" if delta >= 0 else "down"}">{"↑" if delta >= 0 else "↓"} {delta:.2f}</div>'
+            
             st.markdown(f"""
             <div class="enterprise-section">
                 <h3>RAIN™ Biometric Security Analysis</h3>
                 <div class="security-status {security_status}">
                     {security_message}
                 </div>
+                <div class="speed-metrics">
+                    <div class="speed-metric">
+                        <div class="label">Current Typing Speed</div>
+                        <div class="value">{last_speed:.2f} keystrokes/sec</div>
+                        {speed_delta}
+                    </div>
+                    <div class="speed-metric">
+                        <div class="label">Average Typing Speed</div>
+                        <div class="value">{avg_speed:.2f} keystrokes/sec</div>
+                    </div>
+                </div>
             </div>
             """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric(
-                    "Current Typing Speed", 
-                    f"{st.session_state.last_typing_speed:.2f} keystrokes/sec",
-                    delta=f"{st.session_state.last_typing_speed - avg_speed:.2f}" if len(st.session_state.typing_speeds) > 1 else None
-                )
-            with col2:
-                st.metric(
-                    "Average Typing Speed", 
-                    f"{avg_speed:.2f} keystrokes/sec"
-                )
                 
             # Create an immediate visualization even with minimal keystrokes
-            # This ensures feedback appears right away without waiting for multiple samples
-            fig, ax = plt.subplots(figsize=(10, 3))
-            
-            # If we have real typing speeds, plot them
             if st.session_state.typing_speeds:
-                ax.plot(st.session_state.typing_speeds, color='#0068C9', linewidth=2)
+                speeds = list(st.session_state.typing_speeds)
             else:
                 # Otherwise create a minimal starter chart that still looks meaningful
                 # This makes the interface respond immediately with first keypress
-                ax.plot([4.0], color='#0068C9', linewidth=2)
-                
-            ax.set_ylabel('Keystrokes/sec')
-            ax.set_xlabel('Time (most recent measurements)')
-            ax.set_title('RAIN™ Biometric Typing Pattern Analysis')
-            ax.grid(True, alpha=0.3)
-            
-            # Add horizontal line for average
-            ax.axhline(y=avg_speed, color='#FF5252', linestyle='--', alpha=0.7, label=f'Average: {avg_speed:.2f}')
-            
-            # Add shaded areas for normal vs. suspicious zones
-            ax.axhspan(avg_speed * 0.7, avg_speed * 1.3, alpha=0.2, color='green', label='Normal Range')
-            if avg_speed * 1.3 < 10:  # Don't shade too high
-                ax.axhspan(avg_speed * 1.3, 10, alpha=0.2, color='red', label='Suspicious (Too Fast)')
-            ax.axhspan(0, avg_speed * 0.7, alpha=0.2, color='orange', label='Suspicious (Too Slow)')
+                speeds = [4.0]
             
-            ax.legend()
-            st.pyplot(fig)
+            speed_history = pd.DataFrame({'measurement': np.arange(len(speeds)), 'speed': speeds})
+            chart = alt.layer(
+                _typing_zones_chart(round(float(avg_speed), 1)),
+                _typing_line_chart().properties(data=speed_history),
+                _typing_average_rule(avg_speed)
+            ).properties(title='RAIN™ Biometric Typing Pattern Analysis', height=220)
+            st.altair_chart(chart, use_container_width=True, key=f"typing_chart{key_suffix}")
             
             # Always show the enterprise-level explanation, even with minimal typing
             # This ensures the first-person narrative appears immediately
@@ -394,8 +489,6 @@ class BiometricCollector:
             """)
         else:
             st.info("Start typing in the box above. I'll instantly analyze your biometric patterns as you type...")
-        
-        return text_input, analyze_button
     
     def simulate_mouse_data(self, normal_count=100, suspicious_count=10):
         """
@@ -416,50 +509,9 @@ class BiometricCollector:
         suspicious_users_df: pandas DataFrame
             DataFrame containing suspicious user behavior data
         """
-        # Set random seed for reproducibility
-        np.random.seed(42)
-        
-        # Generate normal user data with realistic distributions
-        normal_typing_speeds = np.random.normal(4.5, 0.8, normal_count)
-        normal_mouse_speeds = np.random.normal(320.0, 50.0, normal_count)
-        
-        # Different patterns for suspicious users
-        suspicious_types = np.random.choice(['bot_fast', 'bot_slow', 'erratic'], suspicious_count)
-        suspicious_typing_speeds = []
-        suspicious_mouse_speeds = []
-        
-        for suspicious_type in suspicious_types:
-            if suspicious_type == 'bot_fast':
-                # Bots type unnaturally fast and move mouse quickly
-                suspicious_typing_speeds.append(np.random.uniform(7.0, 12.0))
-                suspicious_mouse_speeds.append(np.random.uniform(500.0, 700.0))
-            elif suspicious_type == 'bot_slow':
-                # Bots that move very methodically (too consistent)
-                suspicious_typing_speeds.append(np.random.uniform(1.0, 2.0))
-                suspicious_mouse_speeds.append(np.random.uniform(100.0, 150.0))
-            else:  # erratic
-                # Erratic behavior - unusual combinations
-                suspicious_typing_speeds.append(np.random.uniform(0.5, 1.5))
-                suspicious_mouse_speeds.append(np.random.uniform(600.0, 800.0))
-        
-        # Create DataFrames
-        normal_users_df = pd.DataFrame({
-            'user_id': [f'normal_user_{i}' for i in range(normal_count)],
-            'typing_speed': normal_typing_speeds,
-            'mouse_movement_speed': normal_mouse_speeds,
-            'is_suspicious': False
-        })
-        
-        suspicious_users_df = pd.DataFrame({
-            'user_id': [f'suspicious_user_{i}' for i in range(suspicious_count)],
-            'typing_speed': suspicious_typing_speeds,
-            'mouse_movement_speed': suspicious_mouse_speeds,
-            'is_suspicious': True
-        })
-        
-        return normal_users_df, suspicious_users_df
+        return _simulate_mouse_data(normal_count, suspicious_count)
     
-    def compare_algorithms(self, user_typing_speed, normal_users_df, suspicious_users_df):
+    def compare_algorithms(self, user_typing_speed, normal_users_df, suspicious_users_df, show_plot=True):
         """
         Compare Isolation Forest and One-Class SVM on the user's typing speed
         and simulated mouse data.
@@ -472,6 +524,8 @@ class BiometricCollector:
             DataFrame containing normal user behavior data
         suspicious_users_df: pandas DataFrame
             DataFrame containing suspicious user behavior data
+        show_plot: bool
+            Whether to build the comparison figure; 'plot' is None when False
             
         Returns:
         --------
@@ -479,71 +533,35 @@ class BiometricCollector:
             Dictionary containing anomaly detection results from both algorithms
         """
         # Simulate a reasonable mouse speed for the user based on their typing speed
-        # This creates a more realistic correlation between typing and mouse behavior
-        user_mouse_speed = user_typing_speed * 70 + np.random.normal(0, 20)
+        # This creates a more realistic correlation between typing and mouse behavior.
+        # Seeding from the typing speed keeps repeated analyses of the same sample stable
+        mouse_rng = np.random.default_rng(int(user_typing_speed * 1000))
+        user_mouse_speed = user_typing_speed * 70 + mouse_rng.normal(0, 20)
         if user_mouse_speed < 50:
             user_mouse_speed = 50
         
-        # Combine normal and suspicious data
-        training_df = pd.concat([normal_users_df, suspicious_users_df])
-        X_train = training_df[['typing_speed', 'mouse_movement_speed']]
-        
         # Create user data point
-        user_data = pd.DataFrame({
-            'typing_speed': [user_typing_speed],
-            'mouse_movement_speed': [user_mouse_speed]
-        })
+        user_data = np.array([[user_typing_speed, user_mouse_speed]], dtype=np.float32)
         
-        # Train Isolation Forest model
-        isolation_forest = IsolationForest(
-            contamination=0.1,  # Expect about 10% anomalies
-            random_state=42,
-            n_estimators=100,  # More trees for better accuracy
-            max_samples='auto'
-        )
-        isolation_forest.fit(X_train)
+        # The models are fitted on (and cached by) the population passed in
+        normal_X, suspicious_X = _feature_matrix(normal_users_df), _feature_matrix(suspicious_users_df)
         
         # Get Isolation Forest prediction
+        isolation_forest, _ = _get_isolation_forest(normal_X, suspicious_X)
+        _isolation_forest_agreement(normal_X, suspicious_X)  # One-time check against a 100-tree forest
         if_score = isolation_forest.decision_function(user_data)[0]
         if_normalized_score = (if_score + 0.5) / 1.5  # Convert to 0-1 scale
-        if_prediction = isolation_forest.predict(user_data)[0]
-        if_is_anomaly = if_prediction == -1
-        if_confidence = max(0, min(100, if_normalized_score * 100 if not if_is_anomaly else (1 - if_normalized_score) * 100))
-        
-        # Train One-Class SVM model
-        one_class_svm = OneClassSVM(
-            nu=0.1,  # Similar to contamination
-            kernel='rbf',
-            gamma='scale'
-        )
-        # Train only on normal data for One-Class SVM (more common approach)
-        one_class_svm.fit(normal_users_df[['typing_speed', 'mouse_movement_speed']])
+        if_is_anomaly = bool(if_score < 0)  # predict() is -1 exactly where the score is negative
+        if_confidence = float(np.clip((1 - if_normalized_score if if_is_anomaly else if_normalized_score) * 100, 0, 100))
         
         # Get One-Class SVM prediction
-        svm_prediction = one_class_svm.predict(user_data)[0]
+        one_class_svm, _ = _get_one_class_svm(normal_X)
         svm_score = one_class_svm.decision_function(user_data)[0]
-        svm_normalized_score = 1 / (1 + np.exp(-svm_score))  # Sigmoid to get 0-1 scale
-        svm_is_anomaly = svm_prediction == -1
-        svm_confidence = max(0, min(100, svm_normalized_score * 100 if not svm_is_anomaly else (1 - svm_normalized_score) * 100))
-        
-        # Create visualization comparing the two algorithms
-        fig, ax = plt.subplots(figsize=(10, 6))
+        svm_normalized_score = expit(svm_score)  # Numerically stable sigmoid to get 0-1 scale
+        svm_is_anomaly = bool(svm_score < 0)
+        svm_confidence = float(np.clip((1 - svm_normalized_score if svm_is_anomaly else svm_normalized_score) * 100, 0, 100))
         
-        # Plot normal users
-        ax.scatter(
-            normal_users_df['typing_speed'],
-            normal_users_df['mouse_movement_speed'],
-            color='blue', alpha=0.6, s=50, label='Normal Users'
-        )
-        
-        # Plot suspicious users
-        ax.scatter(
-            suspicious_users_df['typing_speed'],
-            suspicious_users_df['mouse_movement_speed'],
-            color='red', alpha=0.6, s=50, label='Suspicious Users'
-        )
-        
-        # Plot user with appropriate color
+        # Pick the user's verdict and marker style
         if if_is_anomaly and svm_is_anomaly:
             # Both algorithms flag as anomaly - strong red
             user_color = '#ff0000'
@@ -560,6 +578,56 @@ class BiometricCollector:
             marker = 'o'
             verdict = "NORMAL"
         
+        # Skip the visualization (and the 10 000-point boundary evaluation) when only the verdict is needed
+        fig = None
+        if show_plot:
+            fig = self._plot_algorithm_comparison(
+                normal_X, suspicious_X, user_typing_speed, user_mouse_speed,
+                user_color, marker, verdict
+            )
+        
+        # Return results
+        results_dict = {
+            'isolation_forest': {
+                'is_anomaly': if_is_anomaly,
+                'confidence': if_confidence,
+                'verdict': 'Suspicious' if if_is_anomaly else 'Normal'
+            },
+            'one_class_svm': {
+                'is_anomaly': svm_is_anomaly,
+                'confidence': svm_confidence,
+                'verdict': 'Suspicious' if svm_is_anomaly else 'Normal'
+            },
+            'user_data': {
+                'typing_speed': user_typing_speed,
+                'mouse_speed': user_mouse_speed
+            },
+            'plot': fig,
+            'overall_verdict': verdict
+        }
+        
+        return results_dict
+    
+    def _plot_algorithm_comparison(self, normal_X, suspicious_X, user_typing_speed, user_mouse_speed,
+                                   user_color, marker, verdict):
+        """Draw both user populations, the user's point and each model's decision boundary"""
+        # Create visualization comparing the two algorithms
+        fig, ax = plt.subplots(figsize=(10, 6))
+        
+        # Plot normal users
+        ax.scatter(
+            normal_X[:, 0],
+            normal_X[:, 1],
+            color='blue', alpha=0.6, s=50, label='Normal Users'
+        )
+        
+        # Plot suspicious users
+        ax.scatter(
+            suspicious_X[:, 0],
+            suspicious_X[:, 1],
+            color='red', alpha=0.6, s=50, label='Suspicious Users'
+        )
+        
         # Plot user data point with bigger marker
         ax.scatter(
             user_typing_speed, user_mouse_speed,
@@ -571,21 +639,16 @@ class BiometricCollector:
         # Add decision boundaries using contours (simplification for visualization)
         x_min, x_max = ax.get_xlim()
         y_min, y_max = ax.get_ylim()
-        xx, yy = np.meshgrid(
-            np.linspace(x_min, x_max, 100),
-            np.linspace(y_min, y_max, 100)
+        xx, yy, Z_if, Z_svm = _decision_surfaces(
+            normal_X, suspicious_X,
+            round(x_min, 1), round(x_max, 1), round(y_min, 1), round(y_max, 1)
         )
-        grid = np.c_[xx.ravel(), yy.ravel()]
         
         # Isolation Forest boundary
-        Z_if = isolation_forest.decision_function(grid)
-        Z_if = Z_if.reshape(xx.shape)
         contour_if = ax.contour(xx, yy, Z_if, levels=[0], colors=['green'], linestyles=['-'], alpha=0.7)
         plt.clabel(contour_if, inline=True, fontsize=8, fmt='Isolation Forest')
         
         # One-Class SVM boundary
-        Z_svm = one_class_svm.decision_function(grid)
-        Z_svm = Z_svm.reshape(xx.shape)
         contour_svm = ax.contour(xx, yy, Z_svm, levels=[0], colors=['purple'], linestyles=['--'], alpha=0.7)
         plt.clabel(contour_svm, inline=True, fontsize=8, fmt='One-Class SVM')
         
@@ -596,24 +659,4 @@ class BiometricCollector:
         ax.legend(loc='upper right')
         ax.grid(True, alpha=0.3)
         
-        # Return results
-        results_dict = {
-            'isolation_forest': {
-                'is_anomaly': if_is_anomaly,
-                'confidence': if_confidence,
-                'verdict': 'Suspicious' if if_is_anomaly else 'Normal'
-            },
-            'one_class_svm': {
-                'is_anomaly': svm_is_anomaly,
-                'confidence': svm_confidence,
-                'verdict': 'Suspicious' if svm_is_anomaly else 'Normal'
-            },
-            'user_data': {
-                'typing_speed': user_typing_speed,
-                'mouse_speed': user_mouse_speed
-            },
-            'plot': fig,
-            'overall_verdict': verdict
-        }
-        
-        return results_dict
\ No newline at end of file
+        return fig
@@ -1,13 +1,315 @@
 import streamlit as st
+from streamlit.components.v1 import html
 import numpy as np
 import pandas as pd
 import time
-import matplotlib.pyplot as plt
+import altair as alt
 from datetime import datetime, timedelta
 import matplotlib.dates as mdates
-import random
+from matplotlib.figure import Figure
 import json
 import math
+from collections import Counter, deque
+
+# Most recent threat events kept for the timeline and event table
+THREAT_HISTORY_SIZE = 2000
+
+# Riskiest network events listed in the high-risk events table
+HIGH_RISK_EVENT_ROWS = 20
+
+# Different types of events
+NETWORK_EVENT_TYPES = np.array([
+    "Authentication",
+    "File Access",
+    "Network Connection",
+    "Database Query",
+    "API Request",
+    "System Command"
+])
+
+# Event outcomes, weighted towards success
+NETWORK_EVENT_OUTCOMES = np.array(["Success", "Success", "Success", "Success", "Failure", "Suspicious"])
+
+# Server roles used in the target resource names
+NETWORK_RESOURCE_ROLES = np.array(['web', 'db', 'auth', 'api', 'app'])
+
+def _pack_ips(o1, o2, o3, o4):
+    """Pack four arrays of IPv4 octets into uint32 addresses"""
+    return ((np.asarray(o1, dtype=np.uint32) << 24) | (np.asarray(o2, dtype=np.uint32) << 16)
+            | (np.asarray(o3, dtype=np.uint32) << 8) | np.asarray(o4, dtype=np.uint32))
+
+def _format_ips(ips):
+    """Render packed uint32 IPv4 addresses as dotted strings, for display only"""
+    ips = np.asarray(ips, dtype=np.uint32)
+    dotted = (ips >> 24).astype(str)
+    for shift in (16, 8, 0):
+        dotted = np.char.add(np.char.add(dotted, '.'), ((ips >> shift) & 0xFF).astype(str))
+    return dotted
+
+@st.cache_data(ttl=3600)
+def _generate_sample_network_events(count=50, seed=42):
+    """
+    Generate sample network events for demonstration purposes.
+    Built once per hour and shared by new sessions instead of being redrawn for each one.
+    Every column is drawn in one vectorized call from a seeded generator, so the events
+    are determined by (count, seed) and only their timestamps move with the clock.
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Create sample timestamps in the last 24 hours
+    end_time = datetime.now()
+    start_time = end_time - timedelta(hours=24)
+    timestamps = pd.Timestamp(start_time) + pd.to_timedelta(np.sort(rng.integers(1, 24*60, count, endpoint=True)), unit='m')
+    
+    event_types = rng.choice(NETWORK_EVENT_TYPES, count)
+    outcomes = rng.choice(NETWORK_EVENT_OUTCOMES, count)
+    
+    # Generate source IPs with some patterns: 70% internal, 30% external.
+    # Addresses are kept packed as uint32 and only turned into strings for display
+    internal_ips = _pack_ips(192, 168, rng.integers(1, 254, count, endpoint=True), rng.integers(1, 254, count, endpoint=True))
+    external_ips = _pack_ips(rng.integers(1, 223, count, endpoint=True), rng.integers(1, 254, count, endpoint=True),
+                             rng.integers(1, 254, count, endpoint=True), rng.integers(1, 254, count, endpoint=True))
+    source_ips = np.where(rng.random(count) < 0.7, internal_ips, external_ips)
+    
+    # Create risk score - higher for suspicious/failure outcomes
+    risk_scores = np.where(
+        outcomes == "Suspicious", rng.integers(70, 95, count, endpoint=True),
+        np.where(outcomes == "Failure", rng.integers(40, 70, count, endpoint=True), rng.integers(5, 40, count, endpoint=True))
+    )
+    
+    target_resources = np.char.add(
+        np.char.add(np.char.add('srv-', np.char.zfill(rng.integers(1, 20, count, endpoint=True).astype(str), 2)), '.'),
+        np.char.add(rng.choice(NETWORK_RESOURCE_ROLES, count), '.internal')
+    )
+    users = np.char.add('user', np.char.zfill(rng.integers(1, 50, count, endpoint=True).astype(str), 3))
+    
+    # Low-cardinality labels are stored as categoricals (integer codes plus a small lookup);
+    # free-text columns are Arrow-backed strings rather than Python objects
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "timestamp_str": pd.array(timestamps.strftime('%Y-%m-%d %H:%M:%S'), dtype="string[pyarrow]"),  # Formatted once for display
+        "event_type": pd.Categorical(event_types),
+        "outcome": pd.Categorical(outcomes),
+        "source_ip": source_ips,
+        "risk_score": risk_scores.astype(np.int8),  # 5-95 fits in a byte
+        "target_resource": pd.array(target_resources, dtype="string[pyarrow]"),
+        "user": pd.array(users, dtype="string[pyarrow]")
+    })
+
+def _rhythm_stats(intervals):
+    """
+    Mean interval, its standard deviation and the rhythm consistency (%) of a keystroke interval array.
+    Accumulated in float64, since the float32 intervals are too coarse for the variance.
+    """
+    mean_interval = np.mean(intervals, dtype=np.float64)
+    std_interval = np.std(intervals, dtype=np.float64)
+    consistency = 100 * (1 - min(1, std_interval / mean_interval))
+    return mean_interval, std_interval, consistency
+
+@st.cache_data(max_entries=32)
+def _rhythm_baseline(mean_interval, std_interval, count, seed=42):
+    """
+    Simulated user baseline for the rhythm chart.
+    Cached on its distribution and length, so it is drawn once rather than on every rerun.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.normal(mean_interval, std_interval*0.8, count)
+
+def _rhythm_chart_data(intervals, mean_interval, std_interval):
+    """Keystroke intervals next to the simulated user baseline, one row per keystroke"""
+    return pd.DataFrame({
+        'keystroke': np.arange(len(intervals)),
+        'interval': intervals,
+        'baseline': _rhythm_baseline(float(mean_interval), float(std_interval), len(intervals))
+    })
+
+def _rhythm_chart(data):
+    """Keystroke rhythm line chart with the dashed simulated baseline behind it"""
+    x = alt.X('keystroke:Q', title='Keystroke Number')
+    intervals = alt.Chart(data).mark_line(color='#0068C9', strokeWidth=2, point=alt.OverlayMarkDef(color='#0068C9')).encode(
+        x=x,
+        y=alt.Y('interval:Q', title='Time Between Keystrokes (s)'),
+        tooltip=[alt.Tooltip('keystroke:Q', title='Keystroke'), alt.Tooltip('interval:Q', title='Interval', format='.2f')]
+    )
+    baseline = alt.Chart(data).mark_line(color='gray', strokeWidth=1, strokeDash=[4, 4], opacity=0.5).encode(
+        x=x,
+        y='baseline:Q'
+    )
+    return alt.layer(baseline, intervals).properties(title='Keystroke Rhythm Pattern Analysis', height=240)
+
+# Predefined threat scenarios, hotspots and user profiles for the simulation.
+# Static, so every session shares this one copy; pattern histories are float32 arrays
+SIMULATION_DATA = {
+    'threat_scenarios': [
+        {"type": "Ransomware", "severity": "Critical", "location": "Mumbai", "coords": [19.0760, 72.8777], "actor": "BlackMamba"},
+        {"type": "Phishing Campaign", "severity": "High", "location": "Bangalore", "coords": [12.9716, 77.5946], "actor": "SilentViper"},
+        {"type": "Data Exfiltration", "severity": "Critical", "location": "Delhi", "coords": [28.6139, 77.2090], "actor": "CosmicPanda"},
+        {"type": "DDoS Attack", "severity": "Medium", "location": "Chennai", "coords": [13.0827, 80.2707], "actor": "StormRider"},
+        {"type": "Zero-day Exploit", "severity": "Critical", "location": "Hyderabad", "coords": [17.3850, 78.4867], "actor": "Equation Group"},
+        {"type": "Credential Theft", "severity": "High", "location": "Pune", "coords": [18.5204, 73.8567], "actor": "ShadowHammer"},
+        {"type": "Supply Chain Attack", "severity": "Critical", "location": "Kolkata", "coords": [22.5726, 88.3639], "actor": "EmberBear"},
+        {"type": "Insider Threat", "severity": "Medium", "location": "Ahmedabad", "coords": [23.0225, 72.5714], "actor": "Internal Actor"},
+    ],
+    'global_hotspots': [
+        {"location": "Beijing", "coords": [39.9042, 116.4074], "threat_level": 0.8},
+        {"location": "Moscow", "coords": [55.7558, 37.6173], "threat_level": 0.75},
+        {"location": "Tehran", "coords": [35.6892, 51.3890], "threat_level": 0.7},
+        {"location": "Pyongyang", "coords": [39.0392, 125.7625], "threat_level": 0.65},
+        {"location": "Kiev", "coords": [50.4501, 30.5234], "threat_level": 0.6},
+        {"location": "San Francisco", "coords": [37.7749, -122.4194], "threat_level": 0.55},
+        {"location": "London", "coords": [51.5074, -0.1278], "threat_level": 0.5},
+        {"location": "Singapore", "coords": [1.3521, 103.8198], "threat_level": 0.45},
+    ],
+    'user_profiles': [
+        {"id": "admin_user", "typing_patterns": np.array([4.2, 4.5, 4.3, 4.6, 4.4], dtype=np.float32), "mouse_patterns": np.array([320, 330, 310, 325, 315], dtype=np.float32)},
+        {"id": "finance_user", "typing_patterns": np.array([3.8, 3.9, 4.0, 3.7, 3.8], dtype=np.float32), "mouse_patterns": np.array([290, 300, 285, 295, 305], dtype=np.float32)},
+        {"id": "suspicious_user", "typing_patterns": np.array([8.5, 8.7, 8.9, 8.6, 8.8], dtype=np.float32), "mouse_patterns": np.array([550, 560, 570, 555, 565], dtype=np.float32)},
+        {"id": "bot_user", "typing_patterns": np.array([1.5, 1.6, 1.5, 1.5, 1.6], dtype=np.float32), "mouse_patterns": np.array([120, 120, 121, 120, 120], dtype=np.float32)},
+    ]
+}
+
+# Intelligence data from the simulated STIX/TAXII feed
+STIX_INTELLIGENCE = {
+    'threat_actors': ['APT29', 'Lazarus Group', 'Sandworm Team', 'BlackMamba', 'SilentViper', 'CosmicPanda'],
+    'malware_types': ['Ransomware', 'Backdoor', 'Trojan', 'Wiper', 'Cryptojacker', 'Rootkit'],
+    'attack_vectors': ['Phishing', 'Supply Chain', 'Zero-day Exploit', 'Credential Stuffing', 'Man-in-the-Middle'],
+    'industries_targeted': ['Financial', 'Healthcare', 'Critical Infrastructure', 'Government', 'Technology', 'Education']
+}
+
+# Animations for the security posture card; static, so built once at import
+SECURITY_POSTURE_CSS = """
+<style>
+    @keyframes lightning-flash {
+        0% { opacity: 0; }
+        10% { opacity: 0.8; background: white; }
+        15% { opacity: 0.2; }
+        20% { opacity: 0.9; background: rgba(255,255,255,0.9); }
+        25% { opacity: 0.3; }
+        30% { opacity: 0; }
+        100% { opacity: 0; }
+    }
+    
+    @keyframes pulse {
+        0% { transform: scale(1); opacity: 1; box-shadow: 0 0 0 0 rgba(255,255,255,0.7); }
+        70% { transform: scale(1.2); opacity: 0.7; box-shadow: 0 0 0 10px rgba(255,255,255,0); }
+        100% { transform: scale(1); opacity: 1; box-shadow: 0 0 0 0 rgba(255,255,255,0); }
+    }
+    
+    .pulse-circle {
+        animation: pulse 2s infinite;
+    }
+    
+    .lightning {
+        opacity: 0;
+        clip-path: polygon(
+            50% 0%, 
+            65% 30%, 
+            100% 30%, 
+            60% 50%, 
+            75% 70%, 
+            40% 70%, 
+            40% 100%, 
+            25% 60%, 
+            0% 60%, 
+            35% 40%
+        );
+    }
+    
+    .bolt1 {
+        animation: lightning-flash 7s infinite;
+        animation-delay: 1s;
+    }
+    
+    .bolt2 {
+        animation: lightning-flash 8s infinite;
+        animation-delay: 3s;
+    }
+    
+    .bolt3 {
+        animation: lightning-flash 6s infinite;
+        animation-delay: 5s;
+    }
+</style>
+"""
+
+# Security posture card with slots for the score-dependent values
+SECURITY_POSTURE_TEMPLATE = """
+<div style="padding: 20px; border-radius: 10px; background: {gradient}; color: white; position: relative; overflow: hidden; box-shadow: 0 4px 8px rgba(0,0,0,0.2);">
+    <!-- Animated lightning bolts in the background -->
+    <div id="lightning-container" style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; z-index: 1; overflow: hidden;">
+        <div class="lightning bolt1" style="position: absolute; top: 10%; left: 15%; height: 60%; width: 8%;"></div>
+        <div class="lightning bolt2" style="position: absolute; top: 5%; left: 60%; height: 50%; width: 6%;"></div>
+        <div class="lightning bolt3" style="position: absolute; top: 40%; left: 80%; height: 45%; width: 5%;"></div>
+    </div>
+    
+    <!-- Content container above the lightning -->
+    <div style="position: relative; z-index: 2;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <h2 style="margin: 0; font-weight: bold; text-shadow: 1px 1px 3px rgba(0,0,0,0.3);">Security Posture</h2>
+            <div class="pulse-circle" style="background-color: white; width: 15px; height: 15px; border-radius: 50%; margin-right: 10px;"></div>
+        </div>
+        
+        <div style="display: flex; justify-content: space-between; align-items: center; margin: 25px 0 15px 0;">
+            <div style="font-size: 18px; font-weight: bold;">Status: <span style="font-size: 22px; text-shadow: 1px 1px 3px rgba(0,0,0,0.3);">{status}</span></div>
+            <div style="font-size: 42px; font-weight: bold; text-shadow: 2px 2px 4px rgba(0,0,0,0.4);">{score}</div>
+        </div>
+        
+        <div style="height: 15px; background-color: rgba(255,255,255,0.3); border-radius: 10px; width: 100%; margin-bottom: 15px; box-shadow: inset 0 1px 3px rgba(0,0,0,0.2);">
+            <div style="height: 100%; width: {score}%; background-color: white; border-radius: 10px; box-shadow: 0 1px 3px rgba(0,0,0,0.2);"></div>
+        </div>
+        
+        <div style="display: flex; justify-content: space-between; font-size: 14px; opacity: 0.9;">
+            <div>Last updated: Today at {updated}</div>
+            <div>Trend: {trend} this week</div>
+        </div>
+    </div>
+</div>
+
+{css}
+"""
+
+# Command center banner shown above the dashboard
+DASHBOARD_HEADER_HTML = """
+<div style="text-align: center; padding: 10px; background-color: #f0f7ff; border-radius: 5px; margin-bottom: 20px;">
+    <h1 style="color: #0068C9; margin-bottom: 0;">RAIN™ Enterprise Security Command Center</h1>
+    <p style="color: #666;">Real-Time AI-Driven Threat Interceptor and Neutralizer</p>
+</div>
+"""
+
+# Most recent security notifications kept for the notifications panel
+NOTIFICATION_HISTORY_SIZE = 16
+
+# Simulated security notifications as (color, title, time, details)
+SECURITY_NOTIFICATIONS = (
+    ("#f44336", "Critical: Unusual Admin Activity", "2 minutes ago",
+     "Administrative account accessed outside business hours"),
+    ("#ff9800", "Warning: Multiple Failed Logins", "15 minutes ago",
+     "5 failed login attempts for user jsmith"),
+    ("#2196f3", "Info: Security Scan Complete", "1 hour ago",
+     "Scheduled endpoint scan completed with 0 issues"),
+)
+
+NOTIFICATION_TEMPLATE = """
+<div style="border-left: 4px solid {color}; padding-left: 15px; margin-bottom: 15px;">
+    <div style="font-weight: bold; color: {color};">{title}</div>
+    <div style="font-size: 12px; color: #666;">{time}</div>
+    <div>{details}</div>
+</div>
+"""
+
+# Compliance and reporting footer
+COMPLIANCE_FOOTER_HTML = """
+<div style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin-top: 20px;">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <span style="font-weight: bold;">Compliance Status:</span> SOC 2, ISO 27001, GDPR, HIPAA
+        </div>
+        <div>
+            <span style="font-weight: bold;">Last Report:</span> Daily Security Summary (Today, 00:00)
+        </div>
+    </div>
+</div>
+"""
 
 class EnterpriseThreatDashboard:
     """
@@ -15,14 +317,39 @@ class EnterpriseThreatDashboard:
     for the RAIN™ Real-Time AI-Driven Threat Interceptor and Neutralizer
     """
     
+    # Threat levels mapped to numeric values for the timeline, highest first
+    LEVEL_MAP = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1, "None": 0}
+    
+    # Timeline point colors per threat level
+    COLOR_MAP = {
+        "Critical": "#c62828",  # Red
+        "High": "#ff9800",      # Orange
+        "Medium": "#ffeb3b",    # Yellow
+        "Low": "#4caf50",       # Green
+        "None": "#2196f3"       # Blue
+    }
+    
+    # Threat levels in ascending order, so a level's categorical code is its LEVEL_MAP value,
+    # and the matching point color for each code
+    LEVEL_ORDER = list(reversed(LEVEL_MAP))
+    LEVEL_COLORS = np.array(list(map(COLOR_MAP.get, LEVEL_ORDER)))
+    
+    # Accent colors of the most recent threat card
+    ALERT_COLOR_MAP = {
+        "Critical": "#c62828",  # Red
+        "High": "#ff9800"       # Orange
+    }
+    
     def __init__(self):
         """Initialize the enterprise threat dashboard with advanced simulation capabilities"""
         # Initialize session state variables for enterprise dashboard
         if 'threat_history' not in st.session_state:
-            st.session_state.threat_history = []
+            st.session_state.threat_history = deque(maxlen=THREAT_HISTORY_SIZE)
+            # DataFrame view of the history, rebuilt only after new events arrive
+            st.session_state.threat_history_df = None
         if 'network_events' not in st.session_state:
             # Initialize with realistic network events
-            st.session_state.network_events = self._generate_sample_network_events()
+            st.session_state.network_events = _generate_sample_network_events()
         if 'security_posture' not in st.session_state:
             st.session_state.security_posture = 85  # Default security score out of 100
         if 'active_threats' not in st.session_state:
@@ -33,36 +360,9 @@ class EnterpriseThreatDashboard:
             st.session_state.last_threat_update = time.time()
             
         if 'simulation_data' not in st.session_state:
-            # Predefined threat scenarios for simulation
-            st.session_state.simulation_data = {
-                'threat_scenarios': [
-                    {"type": "Ransomware", "severity": "Critical", "location": "Mumbai", "coords": [19.0760, 72.8777], "actor": "BlackMamba"},
-                    {"type": "Phishing Campaign", "severity": "High", "location": "Bangalore", "coords": [12.9716, 77.5946], "actor": "SilentViper"},
-                    {"type": "Data Exfiltration", "severity": "Critical", "location": "Delhi", "coords": [28.6139, 77.2090], "actor": "CosmicPanda"},
-                    {"type": "DDoS Attack", "severity": "Medium", "location": "Chennai", "coords": [13.0827, 80.2707], "actor": "StormRider"},
-                    {"type": "Zero-day Exploit", "severity": "Critical", "location": "Hyderabad", "coords": [17.3850, 78.4867], "actor": "Equation Group"},
-                    {"type": "Credential Theft", "severity": "High", "location": "Pune", "coords": [18.5204, 73.8567], "actor": "ShadowHammer"},
-                    {"type": "Supply Chain Attack", "severity": "Critical", "location": "Kolkata", "coords": [22.5726, 88.3639], "actor": "EmberBear"},
-                    {"type": "Insider Threat", "severity": "Medium", "location": "Ahmedabad", "coords": [23.0225, 72.5714], "actor": "Internal Actor"},
-                ],
-                'global_hotspots': [
-                    {"location": "Beijing", "coords": [39.9042, 116.4074], "threat_level": 0.8},
-                    {"location": "Moscow", "coords": [55.7558, 37.6173], "threat_level": 0.75},
-                    {"location": "Tehran", "coords": [35.6892, 51.3890], "threat_level": 0.7},
-                    {"location": "Pyongyang", "coords": [39.0392, 125.7625], "threat_level": 0.65},
-                    {"location": "Kiev", "coords": [50.4501, 30.5234], "threat_level": 0.6},
-                    {"location": "San Francisco", "coords": [37.7749, -122.4194], "threat_level": 0.55},
-                    {"location": "London", "coords": [51.5074, -0.1278], "threat_level": 0.5},
-                    {"location": "Singapore", "coords": [1.3521, 103.8198], "threat_level": 0.45},
-                ],
-                'user_profiles': [
-                    {"id": "admin_user", "typing_patterns": [4.2, 4.5, 4.3, 4.6, 4.4], "mouse_patterns": [320, 330, 310, 325, 315]},
-                    {"id": "finance_user", "typing_patterns": [3.8, 3.9, 4.0, 3.7, 3.8], "mouse_patterns": [290, 300, 285, 295, 305]},
-                    {"id": "suspicious_user", "typing_patterns": [8.5, 8.7, 8.9, 8.6, 8.8], "mouse_patterns": [550, 560, 570, 555, 565]},
-                    {"id": "bot_user", "typing_patterns": [1.5, 1.6, 1.5, 1.5, 1.6], "mouse_patterns": [120, 120, 121, 120, 120]},
-                ]
-            }
-        
+            # Predefined threat scenarios for simulation, shared read-only by all sessions
+            st.session_state.simulation_data = SIMULATION_DATA
+            
         # Auto-update simulation timer
         if 'auto_update_enabled' not in st.session_state:
             st.session_state.auto_update_enabled = True
@@ -79,76 +379,24 @@ class EnterpriseThreatDashboard:
         if 'stix_taxii_connected' not in st.session_state:
             st.session_state.stix_taxii_connected = False
             
+        # Simulated keystroke rhythm match against the user's baseline
+        if 'rhythm_match' not in st.session_state:
+            st.session_state.rhythm_match = int(np.random.default_rng().integers(70, 99, endpoint=True))
+            
         if 'stix_intelligence' not in st.session_state:
-            # Intelligence data from simulated STIX/TAXII feed
-            st.session_state.stix_intelligence = {
-                'threat_actors': ['APT29', 'Lazarus Group', 'Sandworm Team', 'BlackMamba', 'SilentViper', 'CosmicPanda'],
-                'malware_types': ['Ransomware', 'Backdoor', 'Trojan', 'Wiper', 'Cryptojacker', 'Rootkit'],
-                'attack_vectors': ['Phishing', 'Supply Chain', 'Zero-day Exploit', 'Credential Stuffing', 'Man-in-the-Middle'],
-                'industries_targeted': ['Financial', 'Healthcare', 'Critical Infrastructure', 'Government', 'Technology', 'Education']
-            }
-            
-    def _generate_sample_network_events(self):
-        """Generate sample network events for demonstration purposes"""
-        # Create sample timestamps in the last 24 hours
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=24)
-        
-        # Create 50 random events
-        timestamps = [start_time + timedelta(minutes=random.randint(1, 24*60)) for _ in range(50)]
-        timestamps.sort()
-        
-        # Different types of events
-        event_types = [
-            "Authentication",
-            "File Access",
-            "Network Connection",
-            "Database Query",
-            "API Request",
-            "System Command"
-        ]
-        
-        # Event outcomes
-        outcomes = ["Success", "Success", "Success", "Success", "Failure", "Suspicious"]
-        
-        # Generate source IPs with some patterns
-        def generate_ip():
-            if random.random() < 0.7:  # 70% internal
-                return f"192.168.{random.randint(1, 254)}.{random.randint(1, 254)}"
-            else:  # 30% external
-                return f"{random.randint(1, 223)}.{random.randint(1, 254)}.{random.randint(1, 254)}.{random.randint(1, 254)}"
-        
-        # Create event data
-        events = []
-        for ts in timestamps:
-            event_type = random.choice(event_types)
-            outcome = random.choice(outcomes)
-            source_ip = generate_ip()
-            
-            # Create risk score - higher for suspicious/failure outcomes
-            if outcome == "Suspicious":
-                risk_score = random.randint(70, 95)
-            elif outcome == "Failure":
-                risk_score = random.randint(40, 70)
-            else:
-                risk_score = random.randint(5, 40)
-                
-            events.append({
-                "timestamp": ts,
-                "event_type": event_type,
-                "outcome": outcome,
-                "source_ip": source_ip,
-                "risk_score": risk_score,
-                "target_resource": f"srv-{random.randint(1, 20):02d}.{random.choice(['web', 'db', 'auth', 'api', 'app'])}.internal",
-                "user": f"user{random.randint(1, 50):03d}"
-            })
-        
-        return events
-    
+            # Intelligence data from simulated STIX/TAXII feed, shared read-only by all sessions
+            st.session_state.stix_intelligence = STIX_INTELLIGENCE
+            
+        # Security notifications, newest first
+        if 'notifications' not in st.session_state:
+            st.session_state.notifications = deque(SECURITY_NOTIFICATIONS, maxlen=NOTIFICATION_HISTORY_SIZE)
+            
     def add_threat_event(self, threat_level, details, source="Biometric Analysis"):
         """Add a new threat event to the history"""
+        timestamp = datetime.now()
         event = {
-            "timestamp": datetime.now(),
+            "timestamp": timestamp,
+            "timestamp_str": timestamp.strftime('%Y-%m-%d %H:%M:%S'),  # Formatted once for display
             "threat_level": threat_level,
             "details": details,
             "source": source,
@@ -156,6 +404,7 @@ class EnterpriseThreatDashboard:
         }
         
         st.session_state.threat_history.append(event)
+        st.session_state.threat_history_df = None
         
         # If it's a high or critical threat, add to active threats
         if threat_level in ["Critical", "High"]:
@@ -187,206 +436,100 @@ class EnterpriseThreatDashboard:
             status = "At Risk"
             gradient = "linear-gradient(135deg, #01579B, #0288D1, #03A9F4)"
             
-        # Use streamlit components.html for more advanced visualization
-        from streamlit.components.v1 import html
-        
-        # Create enhanced security posture display with lightning bolt animation
-        
-        # First, define the CSS part as a separate string to avoid f-string parsing issues
-        css_part = """
-        <style>
-            @keyframes lightning-flash {
-                0% { opacity: 0; }
-                10% { opacity: 0.8; background: white; }
-                15% { opacity: 0.2; }
-                20% { opacity: 0.9; background: rgba(255,255,255,0.9); }
-                25% { opacity: 0.3; }
-                30% { opacity: 0; }
-                100% { opacity: 0; }
-            }
-            
-            @keyframes pulse {
-                0% { transform: scale(1); opacity: 1; box-shadow: 0 0 0 0 rgba(255,255,255,0.7); }
-                70% { transform: scale(1.2); opacity: 0.7; box-shadow: 0 0 0 10px rgba(255,255,255,0); }
-                100% { transform: scale(1); opacity: 1; box-shadow: 0 0 0 0 rgba(255,255,255,0); }
-            }
-            
-            .pulse-circle {
-                animation: pulse 2s infinite;
-            }
-            
-            .lightning {
-                opacity: 0;
-                clip-path: polygon(
-                    50% 0%, 
-                    65% 30%, 
-                    100% 30%, 
-                    60% 50%, 
-                    75% 70%, 
-                    40% 70%, 
-                    40% 100%, 
-                    25% 60%, 
-                    0% 60%, 
-                    35% 40%
-                );
-            }
-            
-            .bolt1 {
-                animation: lightning-flash 7s infinite;
-                animation-delay: 1s;
-            }
-            
-            .bolt2 {
-                animation: lightning-flash 8s infinite;
-                animation-delay: 3s;
-            }
-            
-            .bolt3 {
-                animation: lightning-flash 6s infinite;
-                animation-delay: 5s;
-            }
-        </style>
-        """
-        
-        # Now create the HTML with dynamic content
-        security_posture_html = f"""
-        <div style="padding: 20px; border-radius: 10px; background: {gradient}; color: white; position: relative; overflow: hidden; box-shadow: 0 4px 8px rgba(0,0,0,0.2);">
-            <!-- Animated lightning bolts in the background -->
-            <div id="lightning-container" style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; z-index: 1; overflow: hidden;">
-                <div class="lightning bolt1" style="position: absolute; top: 10%; left: 15%; height: 60%; width: 8%;"></div>
-                <div class="lightning bolt2" style="position: absolute; top: 5%; left: 60%; height: 50%; width: 6%;"></div>
-                <div class="lightning bolt3" style="position: absolute; top: 40%; left: 80%; height: 45%; width: 5%;"></div>
-            </div>
-            
-            <!-- Content container above the lightning -->
-            <div style="position: relative; z-index: 2;">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <h2 style="margin: 0; font-weight: bold; text-shadow: 1px 1px 3px rgba(0,0,0,0.3);">Security Posture</h2>
-                    <div class="pulse-circle" style="background-color: white; width: 15px; height: 15px; border-radius: 50%; margin-right: 10px;"></div>
-                </div>
-                
-                <div style="display: flex; justify-content: space-between; align-items: center; margin: 25px 0 15px 0;">
-                    <div style="font-size: 18px; font-weight: bold;">Status: <span style="font-size: 22px; text-shadow: 1px 1px 3px rgba(0,0,0,0.3);">{status}</span></div>
-                    <div style="font-size: 42px; font-weight: bold; text-shadow: 2px 2px 4px rgba(0,0,0,0.4);">{score}</div>
-                </div>
-                
-                <div style="height: 15px; background-color: rgba(255,255,255,0.3); border-radius: 10px; width: 100%; margin-bottom: 15px; box-shadow: inset 0 1px 3px rgba(0,0,0,0.2);">
-                    <div style="height: 100%; width: {score}%; background-color: white; border-radius: 10px; box-shadow: 0 1px 3px rgba(0,0,0,0.2);"></div>
-                </div>
-                
-                <div style="display: flex; justify-content: space-between; font-size: 14px; opacity: 0.9;">
-                    <div>Last updated: Today at {datetime.now().strftime('%H:%M:%S')}</div>
-                    <div>Trend: {'+2 points' if score > 70 else '-1 point'} this week</div>
-                </div>
-            </div>
-        </div>
-        
-        {css_part}
-        """
+        # Fill the dynamic slots of the prebuilt card; the CSS is a module constant
+        security_posture_html = SECURITY_POSTURE_TEMPLATE.format(
+            gradient=gradient,
+            status=status,
+            score=score,
+            updated=datetime.now().strftime('%H:%M:%S'),
+            trend='+2 points' if score > 70 else '-1 point',
+            css=SECURITY_POSTURE_CSS
+        )
         
         # Display using HTML component
         html(security_posture_html, height=250)
         
+    @st.fragment
     def display_active_threats_summary(self):
-        """Display a summary of active threats"""
+        """
+        Display a summary of active threats.
+        Runs as a fragment, so it can rerun on its own without rerunning the rest of the dashboard.
+        """
         active_threats = st.session_state.active_threats
         
         if not active_threats:
             st.success("No active threats detected in your environment")
             return
         
-        # Group threats by level
-        critical = [t for t in active_threats if t["threat_level"] == "Critical"]
-        high = [t for t in active_threats if t["threat_level"] == "High"]
-        medium = [t for t in active_threats if t["threat_level"] == "Medium"]
+        # Count threats by level in a single pass
+        level_counts = Counter(t["threat_level"] for t in active_threats)
+        critical = level_counts["Critical"]
+        high = level_counts["High"]
+        medium = level_counts["Medium"]
         
         # Display summary
         col1, col2, col3 = st.columns(3)
         
         with col1:
             if critical:
-                st.error(f"**Critical Threats:** {len(critical)}")
+                st.error(f"**Critical Threats:** {critical}")
             else:
                 st.success("**Critical Threats:** 0")
                 
         with col2:
             if high:
-                st.warning(f"**High Threats:** {len(high)}")
+                st.warning(f"**High Threats:** {high}")
             else:
                 st.success("**High Threats:** 0")
                 
         with col3:
             if medium:
-                st.info(f"**Medium Threats:** {len(medium)}")
+                st.info(f"**Medium Threats:** {medium}")
             else:
                 st.success("**Medium Threats:** 0")
         
-        # Display the most recent active threat
+        # Display the most recent active threat; threats are appended as they are
+        # detected, so the newest one is always last
         if active_threats:
-            most_recent = max(active_threats, key=lambda x: x["timestamp"])
+            most_recent = active_threats[-1]
             
             st.markdown("### Most Recent Threat")
             
-            if most_recent["threat_level"] == "Critical":
-                alert_color = "#c62828"  # Red
-            elif most_recent["threat_level"] == "High":
-                alert_color = "#ff9800"  # Orange
-            else:
-                alert_color = "#2196f3"  # Blue
+            alert_color = self.ALERT_COLOR_MAP.get(most_recent["threat_level"], "#2196f3")  # Blue otherwise
                 
             st.markdown(f"""
             <div style="padding: 15px; border-radius: 5px; background-color: {alert_color}15; border-left: 5px solid {alert_color}; margin-bottom: 20px;">
                 <div style="display: flex; justify-content: space-between; align-items: center;">
                     <span style="font-weight: bold; color: {alert_color};">{most_recent["threat_level"]} Threat</span>
-                    <span style="color: #666;">{most_recent["timestamp"].strftime("%Y-%m-%d %H:%M:%S")}</span>
+                    <span style="color: #666;">{most_recent["timestamp_str"]}</span>
                 </div>
                 <p style="margin-bottom: 0;"><strong>Source:</strong> {most_recent["source"]}</p>
                 <p style="margin-bottom: 0;"><strong>Details:</strong> {most_recent["details"]}</p>
             </div>
             """, unsafe_allow_html=True)
 
-    def display_threat_timeline(self):
-        """Display a timeline of detected threats"""
-        threats = st.session_state.threat_history
-        
-        if not threats:
-            st.info("No threat history available yet")
-            return
-            
-        # Create timeline data
-        dates = [t["timestamp"] for t in threats]
-        threat_levels = [t["threat_level"] for t in threats]
-        
-        # Map threat levels to numeric values for visualization
-        level_map = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1, "None": 0}
-        y_values = [level_map[level] for level in threat_levels]
-        
-        # Create mapped colors for threat levels
-        colors = {
-            "Critical": "#c62828",  # Red
-            "High": "#ff9800",      # Orange
-            "Medium": "#ffeb3b",    # Yellow
-            "Low": "#4caf50",       # Green
-            "None": "#2196f3"       # Blue
-        }
-        point_colors = [colors[level] for level in threat_levels]
-        
+    def _build_threat_timeline(self):
+        """
+        Create the empty threat timeline: axes, styling and the scatter/line artists.
+        Uses a standalone Figure rather than pyplot, so the session can keep it between reruns.
+        Returns (fig, ax, scatter, line).
+        """
         # Create the timeline visualization
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig = Figure(figsize=(10, 4))
+        ax = fig.subplots()
+        ax.xaxis_date()
         
-        # Plot events as scatter points
-        ax.scatter(dates, y_values, c=point_colors, s=100, zorder=5)
-        
-        # Connect points with lines
-        ax.plot(dates, y_values, color='#aaaaaa', linestyle='-', linewidth=1, alpha=0.3, zorder=1)
+        # Events as scatter points, connected with lines
+        scatter = ax.scatter([], [], s=100, zorder=5)
+        line, = ax.plot([], [], color='#aaaaaa', linestyle='-', linewidth=1, alpha=0.3, zorder=1)
         
         # Format y-axis to show threat levels
-        ax.set_yticks(list(level_map.values()))
-        ax.set_yticklabels(list(level_map.keys()))
+        ax.set_yticks(list(self.LEVEL_MAP.values()))
+        ax.set_yticklabels(list(self.LEVEL_MAP.keys()))
+        ax.set_ylim(-0.2, 4.2)  # Always show every level, whatever the events so far
         
         # Format x-axis to show dates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        fig.autofmt_xdate()
         
         # Add grid and styling
         ax.grid(True, alpha=0.3)
@@ -394,77 +537,114 @@ class EnterpriseThreatDashboard:
         ax.set_xlabel("Date & Time")
         ax.set_ylabel("Threat Level")
         
+        return fig, ax, scatter, line
+    
+    def _update_threat_timeline(self, timeline, df):
+        """Point the existing timeline artists at the events in a threat history DataFrame"""
+        fig, ax, scatter, line = timeline
+        
+        # Create timeline data
+        x_values = mdates.date2num(df['timestamp'])
+        threat_levels = df['threat_level']
+        
+        # Map threat levels to numeric values for visualization; the levels are
+        # listed in ascending order, so the categorical codes are the plot values
+        # and index straight into the per-level colors
+        level_codes = pd.Categorical(threat_levels, categories=self.LEVEL_ORDER).codes
+        
+        # Levels outside LEVEL_MAP are coded -1 and have no place on the axis, so leave them off
+        known = level_codes >= 0
+        x_values, y_values = x_values[known], level_codes[known]
+        point_colors = self.LEVEL_COLORS[y_values]
+        
+        # Swap the data of the existing artists instead of drawing new ones
+        scatter.set_offsets(np.column_stack((x_values, y_values)))
+        scatter.set_facecolors(point_colors)
+        line.set_data(x_values, y_values)
+        
+        # Rescale the time axis to the new points; tick labels are recreated, so rotate them again
+        ax.relim()
+        ax.autoscale_view(scaley=False)
+        fig.autofmt_xdate()
+    
+    def display_threat_timeline(self):
+        """Display a timeline of detected threats"""
+        threats = st.session_state.threat_history
+        
+        if not threats:
+            st.info("No threat history available yet")
+            return
+            
+        # Build the DataFrame view and update the timeline once per change to the
+        # history; reruns without new events re-send the same figure
+        df = st.session_state.threat_history_df
+        if df is None:
+            df = pd.DataFrame(list(threats))
+            st.session_state.threat_history_df = df
+            if st.session_state.get('threat_timeline') is None:
+                st.session_state.threat_timeline = self._build_threat_timeline()
+            self._update_threat_timeline(st.session_state.threat_timeline, df)
+        
         # Show the timeline
-        st.pyplot(fig)
+        st.pyplot(st.session_state.threat_timeline[0], clear_figure=False)
         
         # Display a table of recent threats
         st.markdown("### Recent Threat Events")
         
-        # Convert to DataFrame for display
-        df = pd.DataFrame(threats)
-        df['timestamp'] = df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Show most recent 5 entries
-        st.dataframe(df.tail(5)[['timestamp', 'threat_level', 'source', 'details', 'status']], 
-                    use_container_width=True)
+        # Show most recent 5 entries, with the timestamps formatted when each event was added
+        st.dataframe(df.iloc[-5:][['timestamp_str', 'threat_level', 'source', 'details', 'status']]
+                     .rename(columns={'timestamp_str': 'timestamp'}),
+                     use_container_width=True)
         
     def display_network_activity(self):
         """Display network activity with potential threat detection"""
-        events = st.session_state.network_events
+        # Events are kept as a DataFrame in session state, so there is nothing to convert
+        df = st.session_state.network_events
         
-        if not events:
+        if df.empty:
             st.info("No network activity data available")
             return
             
         # Create a time-based visualization of events
         st.markdown("### Network Activity Monitoring")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(events)
-        
-        # Group by event type
-        event_counts = df.groupby('event_type').size().reset_index(name='count')
-        
-        # Create bar chart
-        fig, ax = plt.subplots(figsize=(10, 5))
-        bars = ax.bar(event_counts['event_type'], event_counts['count'], alpha=0.7)
+        # Count events per type in one pass, in event type order
+        event_counts = df['event_type'].value_counts().sort_index().rename_axis('event_type').reset_index(name='count')
         
+        # Create bar chart, drawn client-side by Vega-Lite
         # Color bars by count (higher counts get attention colors)
-        norm = plt.Normalize(event_counts['count'].min(), event_counts['count'].max())
-        colors = plt.cm.YlOrRd(norm(event_counts['count']))
-        for bar, color in zip(bars, colors):
-            bar.set_color(color)
-            
-        ax.set_xlabel('Event Type')
-        ax.set_ylabel('Event Count (24h)')
-        ax.set_title('Network Activity by Event Type')
-        
-        # Rotate labels for better readability
-        plt.xticks(rotation=45, ha='right')
-        fig.tight_layout()
+        chart = alt.Chart(event_counts).mark_bar(opacity=0.7).encode(
+            x=alt.X('event_type:N', title='Event Type', axis=alt.Axis(labelAngle=-45)),
+            y=alt.Y('count:Q', title='Event Count (24h)'),
+            color=alt.Color('count:Q', scale=alt.Scale(scheme='yelloworangered', zero=False), legend=None),
+            tooltip=[alt.Tooltip('event_type:N', title='Event Type'), alt.Tooltip('count:Q', title='Events')]
+        ).properties(title='Network Activity by Event Type', height=350)
         
         # Display the chart
-        st.pyplot(fig)
+        st.altair_chart(chart, use_container_width=True, key='network_activity')
         
         # Show high-risk events
-        high_risk_events = df[df['risk_score'] > 60].sort_values('risk_score', ascending=False)
+        high_risk_events = df[df['risk_score'] > 60].nlargest(HIGH_RISK_EVENT_ROWS, 'risk_score')
         
         if not high_risk_events.empty:
             st.markdown("### High Risk Network Events")
             
-            # Format timestamps
-            high_risk_events['timestamp'] = high_risk_events['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Display as a table
+            # Display as a table, using the timestamps formatted when the events were generated
             st.dataframe(
-                high_risk_events[['timestamp', 'event_type', 'source_ip', 'risk_score', 'outcome', 'target_resource']], 
+                high_risk_events[['timestamp_str', 'event_type', 'source_ip', 'risk_score', 'outcome', 'target_resource']]
+                .assign(source_ip=_format_ips(high_risk_events['source_ip']))
+                .rename(columns={'timestamp_str': 'timestamp'}),
                 use_container_width=True
             )
         else:
             st.success("No high-risk network events detected")
 
+    @st.fragment
     def display_enterprise_threat_map(self):
-        """Display a global threat map visualization"""
+        """
+        Display a global threat map visualization.
+        Runs as a fragment, so the STIX/TAXII controls only rerun the map panel.
+        """
         st.markdown("### RAIN™ Global Threat Intelligence Map")
         
         # Add STIX/TAXII connection options
@@ -604,17 +784,16 @@ class EnterpriseThreatDashboard:
             return
             
         # Create sample keystroke rhythm data
-        # In a real system, this would be actual intervals between keypresses
-        intervals = np.diff(typing_data)
+        # In a real system, this would be actual intervals between keypresses.
+        # The typing history is converted once to a contiguous float32 array for the stats and chart
+        intervals = np.diff(np.ascontiguousarray(typing_data, dtype=np.float32))
         
         if len(intervals) == 0:
             st.info("More typing data needed for rhythm analysis")
             return
             
         # Calculate metrics
-        mean_interval = np.mean(intervals)
-        std_interval = np.std(intervals)
-        consistency = 100 * (1 - min(1, std_interval / mean_interval))
+        mean_interval, std_interval, consistency = _rhythm_stats(intervals)
         
         # Display metrics
         col1, col2, col3 = st.columns(3)
@@ -626,28 +805,16 @@ class EnterpriseThreatDashboard:
             st.metric("Rhythm Consistency", f"{consistency:.1f}%")
             
         with col3:
-            rhythm_match = random.randint(70, 99)  # In real system, this would be compared to baseline
+            # In real system, this would be compared to baseline; drawn once per session so it holds steady
+            rhythm_match = st.session_state.rhythm_match
             st.metric("Baseline Match", f"{rhythm_match}%", delta=f"{rhythm_match-85}" if rhythm_match != 85 else None)
         
-        # Visualize the keystroke pattern
-        fig, ax = plt.subplots(figsize=(10, 3))
-        
-        # Plot intervals
-        x = np.arange(len(intervals))
-        ax.plot(x, intervals, color='#0068C9', linewidth=2, marker='o')
-        
-        # Add user baseline for comparison (simulated)
-        baseline = np.random.normal(mean_interval, std_interval*0.8, len(intervals))
-        ax.plot(x, baseline, color='gray', linewidth=1, linestyle='--', alpha=0.5, label='User Baseline')
-        
-        # Add styling
-        ax.set_xlabel('Keystroke Number')
-        ax.set_ylabel('Time Between Keystrokes (s)')
-        ax.set_title('Keystroke Rhythm Pattern Analysis')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        
-        st.pyplot(fig)
+        # Visualize the keystroke pattern, drawn client-side against the cached baseline
+        st.altair_chart(
+            _rhythm_chart(_rhythm_chart_data(intervals, mean_interval, std_interval)),
+            use_container_width=True,
+            key='keystroke_rhythm'
+        )
         
         # Add typing pattern analysis
         st.markdown("""
@@ -664,14 +831,37 @@ class EnterpriseThreatDashboard:
         These factors create a unique behavioral fingerprint that's extremely difficult to forge.
         """)
     
+    @st.fragment
+    def display_autonomous_response(self):
+        """
+        Display the autonomous response controls.
+        Runs as a fragment, so changing the response level or clicking a button only reruns these controls.
+        """
+        st.markdown("### Autonomous Response")
+        st.selectbox("Set response level:", 
+                   ["Monitor Only", "Alert Only", "Active Response (User Approval)", "Full Autonomous Response"],
+                   index=2)
+                   
+        response_col1, response_col2 = st.columns(2)
+        with response_col1:
+            st.button("Acknowledge All", type="primary")
+        with response_col2:
+            st.button("Escalate to SOC")
+    
+    @st.fragment
+    def display_security_notifications(self):
+        """Display the security notifications panel"""
+        st.markdown("### Security Notifications")
+        
+        # One pure-HTML element for the whole feed, skipping the markdown parser
+        st.html("".join(
+            NOTIFICATION_TEMPLATE.format(color=color, title=title, time=time_ago, details=details)
+            for color, title, time_ago, details in st.session_state.notifications
+        ))
+    
     def display_enterprise_dashboard(self):
         """Display the main enterprise security dashboard"""
-        st.markdown("""
-        <div style="text-align: center; padding: 10px; background-color: #f0f7ff; border-radius: 5px; margin-bottom: 20px;">
-            <h1 style="color: #0068C9; margin-bottom: 0;">RAIN™ Enterprise Security Command Center</h1>
-            <p style="color: #666;">Real-Time AI-Driven Threat Interceptor and Neutralizer</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(DASHBOARD_HEADER_HTML)
         
         # Display the security posture score
         self.display_security_posture()
@@ -688,39 +878,10 @@ class EnterpriseThreatDashboard:
             
         with col2:
             # Simulate security notifications
-            st.markdown("### Security Notifications")
-            
-            st.markdown("""
-            <div style="border-left: 4px solid #f44336; padding-left: 15px; margin-bottom: 15px;">
-                <div style="font-weight: bold; color: #f44336;">Critical: Unusual Admin Activity</div>
-                <div style="font-size: 12px; color: #666;">2 minutes ago</div>
-                <div>Administrative account accessed outside business hours</div>
-            </div>
-            
-            <div style="border-left: 4px solid #ff9800; padding-left: 15px; margin-bottom: 15px;">
-                <div style="font-weight: bold; color: #ff9800;">Warning: Multiple Failed Logins</div>
-                <div style="font-size: 12px; color: #666;">15 minutes ago</div>
-                <div>5 failed login attempts for user jsmith</div>
-            </div>
-            
-            <div style="border-left: 4px solid #2196f3; padding-left: 15px; margin-bottom: 15px;">
-                <div style="font-weight: bold; color: #2196f3;">Info: Security Scan Complete</div>
-                <div style="font-size: 12px; color: #666;">1 hour ago</div>
-                <div>Scheduled endpoint scan completed with 0 issues</div>
-            </div>
-            """, unsafe_allow_html=True)
+            self.display_security_notifications()
             
             # Add response options
-            st.markdown("### Autonomous Response")
-            st.selectbox("Set response level:", 
-                       ["Monitor Only", "Alert Only", "Active Response (User Approval)", "Full Autonomous Response"],
-                       index=2)
-                       
-            response_col1, response_col2 = st.columns(2)
-            with response_col1:
-                st.button("Acknowledge All", type="primary")
-            with response_col2:
-                st.button("Escalate to SOC")
+            self.display_autonomous_response()
         
         # Show detailed sections
         tab1, tab2, tab3 = st.tabs(["Threat Timeline", "Network Activity", "Keystroke Analysis"])
@@ -738,15 +899,4 @@ class EnterpriseThreatDashboard:
                 st.info("No typing data available yet. Use the biometric analyzer to generate data.")
         
         # Add compliance and reporting footer
-        st.markdown("""
-        <div style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin-top: 20px;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <span style="font-weight: bold;">Compliance Status:</span> SOC 2, ISO 27001, GDPR, HIPAA
-                </div>
-                <div>
-                    <span style="font-weight: bold;">Last Report:</span> Daily Security Summary (Today, 00:00)
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        st.html(COMPLIANCE_FOOTER_HTML)
\ No newline at end of file
@@ -1,7 +1,81 @@
 import streamlit as st
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from io import BytesIO
 import numpy as np
 
+@st.cache_data
+def create_risk_dashboard_png(industries, risk_levels, enterprise_colors):
+    """
+    Render the client quantum risk dashboard to PNG bytes once per set of risk values.
+    Uses a standalone Figure, so nothing is shared between sessions or left in pyplot's registry.
+    """
+    fig = Figure(figsize=(12, 6), facecolor=enterprise_colors['background'])
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    # Left panel: Industry risk levels
+    
+    # Create horizontal bar chart with enterprise styling
+    bars = ax1.barh(industries, risk_levels, color=enterprise_colors['warning'], 
+                  height=0.5, alpha=0.7)
+    
+    # Add risk percentage labels in a single call
+    ax1.bar_label(bars, labels=[f'{v}%' for v in risk_levels], padding=3,
+                  color=enterprise_colors['primary'], fontweight='bold')
+    
+    # Risk threshold line
+    ax1.axvline(x=75, color=enterprise_colors['accent'], linestyle='--', 
+              alpha=0.8, label='Critical Risk Threshold')
+    
+    ax1.set_xlim(0, 100)
+    ax1.set_xlabel('Quantum Risk Exposure (%)', fontsize=10, color=enterprise_colors['primary'])
+    ax1.set_title('Industry Quantum Risk Assessment', 
+                fontsize=12, fontweight='bold', color=enterprise_colors['primary'])
+    ax1.grid(True, axis='x', alpha=0.3)
+    
+    # Right panel: Timeline projection
+    years = np.array([2023, 2024, 2025, 2026, 2027, 2028, 2029, 2030])
+    client_exposure = np.array([15, 28, 42, 58, 75, 92, 98, 100])
+    implementation_rate = np.array([5, 15, 30, 50, 75, 90, 98, 100])
+    
+    ax2.plot(years, client_exposure, 'o-', color=enterprise_colors['warning'], 
+           linewidth=3, label='Clients at Risk')
+    ax2.plot(years, implementation_rate, 's-', color=enterprise_colors['secondary'], 
+           linewidth=3, label='RAIN™ Implementation Rate')
+    
+    # Fill the gap between curves to show protection opportunity
+    ax2.fill_between(years, client_exposure, implementation_rate, 
+                   where=(client_exposure > implementation_rate),
+                   color=enterprise_colors['warning'], alpha=0.2, 
+                   label='Security Gap')
+    
+    ax2.fill_between(years, client_exposure, implementation_rate, 
+                   where=(implementation_rate >= client_exposure),
+                   color=enterprise_colors['secondary'], alpha=0.2, 
+                   label='Protected Clients')
+    
+    ax2.set_xlabel('Year', fontsize=10, color=enterprise_colors['primary'])
+    ax2.set_ylabel('Percentage of Clients', fontsize=10, color=enterprise_colors['primary'])
+    ax2.set_title('Quantum Threat Timeline vs. Implementation', 
+                fontsize=12, fontweight='bold', color=enterprise_colors['primary'])
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(loc='upper left', framealpha=0.9, fontsize=8)
+    
+    # Main figure title for enterprise styling
+    fig.suptitle('Infosys Client Quantum Risk Assessment Dashboard', 
+               fontsize=14, fontweight='bold', color=enterprise_colors['primary'], y=0.98)
+    
+    # Infosys footer
+    fig.text(0.99, 0.01, 'Infosys Confidential | © 2025', ha='right', 
+            fontsize=8, color=enterprise_colors['primary'], fontstyle='italic')
+    
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.9)
+    
+    png = BytesIO()
+    fig.savefig(png, format='png', dpi=200, bbox_inches='tight')
+    return png.getvalue()
+
 def display_presentation_guide():
     """Display the enterprise-focused presentation guide for Infosys pitch in first-person narrative"""
     
@@ -158,6 +232,7 @@ def display_presentation_guide():
                           color=color, fontsize=9, fontweight='bold')
         
         st.pyplot(fig)
+        plt.close(fig)
     
     # Second slide - enterprise threat dashboard
     with st.expander("Visual 2: Infosys Client Quantum Risk Dashboard", expanded=True):
@@ -198,73 +273,11 @@ def display_presentation_guide():
         st.markdown("**Enterprise Dashboard Example:**")
         
         # Create a visual example for the enterprise dashboard
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6), facecolor=enterprise_colors['background'])
-        
-        # Left panel: Industry risk levels
-        industries = ['Financial', 'Healthcare', 'Manufacturing', 'Government', 'Retail']
-        risk_levels = [89, 94, 77, 96, 82]
-        
-        # Create horizontal bar chart with enterprise styling
-        bars = ax1.barh(industries, risk_levels, color=enterprise_colors['warning'], 
-                      height=0.5, alpha=0.7)
-        
-        # Add risk percentage labels
-        for bar in bars:
-            width = bar.get_width()
-            ax1.text(width + 1, bar.get_y() + bar.get_height()/2, 
-                   f'{width}%', ha='left', va='center', 
-                   color=enterprise_colors['primary'], fontweight='bold')
-        
-        # Risk threshold line
-        ax1.axvline(x=75, color=enterprise_colors['accent'], linestyle='--', 
-                  alpha=0.8, label='Critical Risk Threshold')
-        
-        ax1.set_xlim(0, 100)
-        ax1.set_xlabel('Quantum Risk Exposure (%)', fontsize=10, color=enterprise_colors['primary'])
-        ax1.set_title('Industry Quantum Risk Assessment', 
-                    fontsize=12, fontweight='bold', color=enterprise_colors['primary'])
-        ax1.grid(True, axis='x', alpha=0.3)
-        
-        # Right panel: Timeline projection
-        years = np.array([2023, 2024, 2025, 2026, 2027, 2028, 2029, 2030])
-        client_exposure = np.array([15, 28, 42, 58, 75, 92, 98, 100])
-        implementation_rate = np.array([5, 15, 30, 50, 75, 90, 98, 100])
-        
-        ax2.plot(years, client_exposure, 'o-', color=enterprise_colors['warning'], 
-               linewidth=3, label='Clients at Risk')
-        ax2.plot(years, implementation_rate, 's-', color=enterprise_colors['secondary'], 
-               linewidth=3, label='RAIN™ Implementation Rate')
-        
-        # Fill the gap between curves to show protection opportunity
-        ax2.fill_between(years, client_exposure, implementation_rate, 
-                       where=(client_exposure > implementation_rate),
-                       color=enterprise_colors['warning'], alpha=0.2, 
-                       label='Security Gap')
-        
-        ax2.fill_between(years, client_exposure, implementation_rate, 
-                       where=(implementation_rate >= client_exposure),
-                       color=enterprise_colors['secondary'], alpha=0.2, 
-                       label='Protected Clients')
-        
-        ax2.set_xlabel('Year', fontsize=10, color=enterprise_colors['primary'])
-        ax2.set_ylabel('Percentage of Clients', fontsize=10, color=enterprise_colors['primary'])
-        ax2.set_title('Quantum Threat Timeline vs. Implementation', 
-                    fontsize=12, fontweight='bold', color=enterprise_colors['primary'])
-        ax2.grid(True, alpha=0.3)
-        ax2.legend(loc='upper left', framealpha=0.9, fontsize=8)
-        
-        # Main figure title for enterprise styling
-        fig.suptitle('Infosys Client Quantum Risk Assessment Dashboard', 
-                   fontsize=14, fontweight='bold', color=enterprise_colors['primary'], y=0.98)
-        
-        # Infosys footer
-        fig.text(0.99, 0.01, 'Infosys Confidential | © 2025', ha='right', 
-                fontsize=8, color=enterprise_colors['primary'], fontstyle='italic')
-        
-        fig.tight_layout()
-        fig.subplots_adjust(top=0.9)
-        
-        st.pyplot(fig)
+        st.image(create_risk_dashboard_png(
+            ('Financial', 'Healthcare', 'Manufacturing', 'Government', 'Retail'),
+            (89, 94, 77, 96, 82),
+            enterprise_colors
+        ))
     
     # Enterprise Pitch Deck Structure - updated for Infosys with first-person narrative
     st.subheader("How I Can Transform Infosys Security Services")
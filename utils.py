@@ -1,4 +1,13 @@
 import streamlit as st
+import numpy as np
+
+# Uniform (typing low, typing high, mouse low, mouse high) ranges per suspicious pattern:
+# bot_fast, bot_slow, erratic
+SUSPICIOUS_PATTERN_RANGES = np.array([
+    [7.0, 12.0, 500.0, 700.0],   # Bots type unnaturally fast and move mouse quickly
+    [1.0, 2.0, 100.0, 150.0],    # Bots that move very methodically (too consistent)
+    [0.5, 1.5, 600.0, 800.0]     # Erratic behavior - unusual combinations
+])
 
 def load_logo():
     """
@@ -51,3 +60,40 @@ def display_security_metrics(detection_rate, false_positive_rate, response_time)
             delta="-15ms" if response_time < 100 else "10ms",
             delta_color="inverse"  # Green when going down
         )
+
+def simulate_user_population(normal_count, suspicious_count, seed=42):
+    """
+    Draw typing and mouse speeds for the simulated user population in bulk.
+    Shared by the zero trust and biometric comparisons, so both see the same seeded population.
+    
+    Returns:
+    --------
+    (normal_typing, normal_mouse, suspicious_typing, suspicious_mouse): tuple of numpy arrays
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Generate normal user data with realistic distributions
+    normal_typing_speeds = rng.normal(4.5, 0.8, normal_count)
+    normal_mouse_speeds = rng.normal(320.0, 50.0, normal_count)
+    
+    # Pick a suspicious pattern per user and sample all of them at once
+    ranges = SUSPICIOUS_PATTERN_RANGES[rng.integers(0, len(SUSPICIOUS_PATTERN_RANGES), suspicious_count)]
+    suspicious_typing_speeds = rng.uniform(ranges[:, 0], ranges[:, 1])
+    suspicious_mouse_speeds = rng.uniform(ranges[:, 2], ranges[:, 3])
+    
+    return normal_typing_speeds, normal_mouse_speeds, suspicious_typing_speeds, suspicious_mouse_speeds
+
+def decision_grid(x_min, x_max, y_min, y_max, resolution=100):
+    """
+    Build the (resolution**2, 2) float32 grid of points to score for decision boundary contours.
+    
+    Returns:
+    --------
+    (xx, yy, grid): xx and yy are reshaped views of the grid columns, ready for ax.contour
+    """
+    x = np.linspace(x_min, x_max, resolution, dtype=np.float32)
+    y = np.linspace(y_min, y_max, resolution, dtype=np.float32)
+    grid = np.empty((resolution * resolution, 2), dtype=np.float32)
+    grid[:, 0] = np.tile(x, resolution)
+    grid[:, 1] = np.repeat(y, resolution)
+    return grid[:, 0].reshape(resolution, resolution), grid[:, 1].reshape(resolution, resolution), grid
@@ -2,12 +2,66 @@ import numpy as np
 import pandas as pd
 from sklearn.ensemble import IsolationForest
 from sklearn.svm import OneClassSVM
+from scipy.special import expit
 import streamlit as st
 import time
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import random
+from dataclasses import dataclass
 import google.generativeai as genai
+from utils import simulate_user_population, decision_grid
+
+@st.cache_resource
+def _fit_baseline_models(normal_df, suspicious_df):
+    """Train the baseline Isolation Forest and One-Class SVM once per training set"""
+    # Combine data for training
+    all_data = pd.concat([normal_df, suspicious_df])
+    X_train = all_data[['typing_speed', 'mouse_movement_speed']]
+    
+    # Train Isolation Forest model
+    isolation_forest = IsolationForest(
+        contamination=0.1,  # Expect about 10% anomalies
+        random_state=42,
+        n_estimators=100,
+        n_jobs=-1  # Build and score trees on all cores
+    )
+    isolation_forest.fit(X_train)
+    
+    # Train One-Class SVM model
+    one_class_svm = OneClassSVM(
+        nu=0.1,  # Similar to contamination
+        kernel='rbf',
+        gamma='scale'
+    )
+    # Train only on normal data for One-Class SVM (common approach for OC-SVM)
+    one_class_svm.fit(normal_df[['typing_speed', 'mouse_movement_speed']])
+    
+    return isolation_forest, one_class_svm
+
+@dataclass(slots=True)
+class UserPopulation:
+    """
+    Struct-of-arrays view of the simulated user population used on hot paths
+    (plots, histograms and model input) instead of the per-group DataFrames.
+    """
+    typing: np.ndarray
+    mouse: np.ndarray
+    label: np.ndarray  # 0 = normal user, 1 = suspicious user
+    
+    @classmethod
+    def from_frames(cls, normal_users_df, suspicious_users_df):
+        """Build the population from the DataFrames returned by generate_user_data"""
+        frames = [df for df in (normal_users_df, suspicious_users_df) if df is not None and not df.empty]
+        return cls(
+            typing=np.concatenate([df['typing_speed'].to_numpy(dtype=np.float64) for df in frames]),
+            mouse=np.concatenate([df['mouse_movement_speed'].to_numpy(dtype=np.float64) for df in frames]),
+            label=np.concatenate([df['is_suspicious'].to_numpy(dtype=np.uint8) for df in frames])
+        )
+    
+    def features(self):
+        """Return the (n_users, 2) typing/mouse feature matrix for model training"""
+        return np.column_stack((self.typing, self.mouse)).astype(np.float32)
 
 class ZeroTrustSecuritySystem:
     """
@@ -146,27 +200,9 @@ class ZeroTrustSecuritySystem:
         st.session_state.normal_baseline = normal_df
         st.session_state.suspicious_baseline = suspicious_df
         
-        # Combine data for training
-        all_data = pd.concat([normal_df, suspicious_df])
-        X_train = all_data[['typing_speed', 'mouse_movement_speed']]
-        
-        # Train and store Isolation Forest model
-        isolation_forest = IsolationForest(
-            contamination=0.1,  # Expect about 10% anomalies
-            random_state=42,
-            n_estimators=100
-        )
-        isolation_forest.fit(X_train)
+        # Fitted models are shared by every session trained on the same (seeded) baseline
+        isolation_forest, one_class_svm = _fit_baseline_models(normal_df, suspicious_df)
         st.session_state.behavioral_models['isolation_forest'] = isolation_forest
-        
-        # Train and store One-Class SVM model
-        one_class_svm = OneClassSVM(
-            nu=0.1,  # Similar to contamination
-            kernel='rbf',
-            gamma='scale'
-        )
-        # Train only on normal data for One-Class SVM (common approach for OC-SVM)
-        one_class_svm.fit(normal_df[['typing_speed', 'mouse_movement_speed']])
         st.session_state.behavioral_models['one_class_svm'] = one_class_svm
     
     def _generate_threat_indicators(self):
@@ -204,31 +240,11 @@ class ZeroTrustSecuritySystem:
         Enhanced with more realistic patterns.
         """
         try:
-            # Set random seed for reproducibility
-            np.random.seed(42)
-            
-            # Generate normal user data with realistic distributions
-            normal_typing_speeds = np.random.normal(4.5, 0.8, normal_count)
-            normal_mouse_speeds = np.random.normal(320.0, 50.0, normal_count)
-            
-            # Different patterns for suspicious users
-            suspicious_types = np.random.choice(['bot_fast', 'bot_slow', 'erratic'], suspicious_count)
-            suspicious_typing_speeds = []
-            suspicious_mouse_speeds = []
-            
-            for suspicious_type in suspicious_types:
-                if suspicious_type == 'bot_fast':
-                    # Bots type unnaturally fast and move mouse quickly
-                    suspicious_typing_speeds.append(np.random.uniform(7.0, 12.0))
-                    suspicious_mouse_speeds.append(np.random.uniform(500.0, 700.0))
-                elif suspicious_type == 'bot_slow':
-                    # Bots that move very methodically (too consistent)
-                    suspicious_typing_speeds.append(np.random.uniform(1.0, 2.0))
-                    suspicious_mouse_speeds.append(np.random.uniform(100.0, 150.0))
-                else:  # erratic
-                    # Erratic behavior - unusual combinations
-                    suspicious_typing_speeds.append(np.random.uniform(0.5, 1.5))
-                    suspicious_mouse_speeds.append(np.random.uniform(600.0, 800.0))
+            # Sample the whole population in vectorized form (seeded for reproducibility)
+            (normal_typing_speeds, normal_mouse_speeds,
+             suspicious_typing_speeds, suspicious_mouse_speeds) = simulate_user_population(
+                normal_count, suspicious_count
+            )
             
             # Create DataFrames
             normal_users_df = pd.DataFrame({
@@ -278,7 +294,7 @@ class ZeroTrustSecuritySystem:
         else:
             return 'very_fast', 'extremely fast'
     
-    def check_user_behavior(self, user_data):
+    def check_user_behavior(self, user_data, show_plot=True):
         """
         Check if a user's behavior is anomalous using multiple detection methods
         and integrating AI threat intelligence for enhanced analysis
@@ -287,6 +303,8 @@ class ZeroTrustSecuritySystem:
         -----------
         user_data: dict
             Dictionary with user behavior data including typing_speed and mouse_speed
+        show_plot: bool
+            Whether to build the detection figure; 'plot' is None when False
         
         Returns:
         --------
@@ -309,17 +327,15 @@ class ZeroTrustSecuritySystem:
             if_model = st.session_state.behavioral_models['isolation_forest']
             if_score = if_model.decision_function(user_df)[0]
             if_normalized_score = (if_score + 0.5) / 1.5  # Convert to 0-1 scale
-            if_prediction = if_model.predict(user_df)[0]
-            if_is_anomaly = if_prediction == -1
-            if_confidence = max(0, min(100, if_normalized_score * 100 if not if_is_anomaly else (1 - if_normalized_score) * 100))
+            if_is_anomaly = bool(if_score < 0)  # predict() is -1 exactly where the score is negative
+            if_confidence = float(np.clip((1 - if_normalized_score if if_is_anomaly else if_normalized_score) * 100, 0, 100))
             
             # One-Class SVM
             svm_model = st.session_state.behavioral_models['one_class_svm']
-            svm_prediction = svm_model.predict(user_df)[0]
             svm_score = svm_model.decision_function(user_df)[0]
-            svm_normalized_score = 1 / (1 + np.exp(-svm_score))  # Sigmoid to get 0-1 scale
-            svm_is_anomaly = svm_prediction == -1
-            svm_confidence = max(0, min(100, svm_normalized_score * 100 if not svm_is_anomaly else (1 - svm_normalized_score) * 100))
+            svm_normalized_score = expit(svm_score)  # Numerically stable sigmoid to get 0-1 scale
+            svm_is_anomaly = bool(svm_score < 0)
+            svm_confidence = float(np.clip((1 - svm_normalized_score if svm_is_anomaly else svm_normalized_score) * 100, 0, 100))
             
             # Store detection results for AI analysis
             detection_results = {
@@ -338,8 +354,10 @@ class ZeroTrustSecuritySystem:
             # Generate comprehensive analysis using AI or rule-based system
             threat_analysis = self.analyze_threat(user_data, detection_results)
             
-            # Create visualization comparing both algorithms
-            fig = self.create_detection_visualization(typing_speed, mouse_speed, if_is_anomaly, svm_is_anomaly)
+            # Create visualization comparing both algorithms (skipped when only the verdict is needed)
+            fig = None
+            if show_plot:
+                fig = self.create_detection_visualization(typing_speed, mouse_speed, if_is_anomaly, svm_is_anomaly)
             
             # Determine overall security verdict
             if if_is_anomaly and svm_is_anomaly:
@@ -606,11 +624,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
             # Add decision boundaries using contours (simplification for visualization)
             x_min, x_max = ax.get_xlim()
             y_min, y_max = ax.get_ylim()
-            xx, yy = np.meshgrid(
-                np.linspace(x_min, x_max, 100),
-                np.linspace(y_min, y_max, 100)
-            )
-            grid = np.c_[xx.ravel(), yy.ravel()]
+            xx, yy, grid = decision_grid(x_min, x_max, y_min, y_max)
             
             # Isolation Forest boundary
             if_model = st.session_state.behavioral_models['isolation_forest']
@@ -768,11 +782,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
             # Add decision boundaries using contours
             x_min, x_max = ax.get_xlim()
             y_min, y_max = ax.get_ylim()
-            xx, yy = np.meshgrid(
-                np.linspace(x_min, x_max, 100),
-                np.linspace(y_min, y_max, 100)
-            )
-            grid = np.c_[xx.ravel(), yy.ravel()]
+            xx, yy, grid = decision_grid(x_min, x_max, y_min, y_max)
             
             # Get models
             if_model = st.session_state.behavioral_models.get('isolation_forest')
@@ -800,6 +810,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
             
             # Show the figure
             st.pyplot(fig)
+            plt.close(fig)
             
             st.markdown("""
             **How Zero Trust Behavioral Analysis Works:**
@@ -1009,10 +1020,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
                 bars = ax.bar(tactics, coverage, color='#0068C9')
                 
                 # Add data labels
-                for bar in bars:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                            f'{height}%', ha='center', va='bottom')
+                ax.bar_label(bars, fmt='%d%%', padding=1)
                 
                 ax.set_ylim(0, 100)
                 ax.set_ylabel('Coverage (%)')
@@ -1028,6 +1036,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
                 plt.tight_layout()
                 
                 st.pyplot(fig)
+                plt.close(fig)
             else:
                 st.info("Connect to a threat intelligence feed to view threat data.")
         
@@ -1153,10 +1162,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
                 bars = ax2.bar(device_types, device_compliance, color='#0068c9')
                 
                 # Add data labels
-                for bar in bars:
-                    height = bar.get_height()
-                    ax2.text(bar.get_x() + bar.get_width()/2., height + 1,
-                            f'{height}%', ha='center', va='bottom')
+                ax2.bar_label(bars, fmt='%d%%', padding=1)
                 
                 ax2.set_ylim(0, 105)
                 ax2.set_ylabel('Compliance Rate (%)')
@@ -1166,6 +1172,7 @@ Your response should start with "Threat Level: " followed by the assessment leve
                 plt.tight_layout()
                 
                 st.pyplot(fig)
+                plt.close(fig)
                 
         st.markdown("---")
         